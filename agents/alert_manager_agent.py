@@ -4,14 +4,21 @@ Handles notifications via email when incidents occur.
 """
 import sys
 from pathlib import Path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
+import atexit
+import html
+import queue
 import smtplib
+import threading
+import time
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime
-from typing import Dict, Any, Optional
+from string import Template
+from typing import Dict, Any, List, Optional, Tuple, Union
 
 from config.config import (
     EMAIL_FROM,
@@ -19,85 +26,380 @@ from config.config import (
     EMAIL_TO,
     SMTP_SERVER,
     SMTP_PORT,
+    SMTP_MAX_MESSAGES_PER_CONNECTION,
+    SMTP_TIMEOUT_SECONDS,
     ALERT_LEVELS,
+    ALERT_QUEUE_SIZE,
+    ALERT_FLUSH_TIMEOUT_SECONDS,
     CRITICAL_SERVICES
 )
 
 
+# -------------------------
+# Alert Level Metadata
+# -------------------------
+
+_UTC_STRFTIME = "%Y-%m-%d %H:%M:%S"
+
+# (emoji, send_email) per level, resolved once at import
+_DEFAULT_LEVEL_META = ("📧", True)
+
+_LEVEL_META = {
+    level: (meta.get("emoji", "📧"), meta.get("send_email", True))
+    for level, meta in ALERT_LEVELS.items()
+}
+
+
+# -------------------------
+# Email Template
+# -------------------------
+
+_DEFAULT_COLOR = "#1976d2"
+
+_COLOR_BY_LEVEL = {
+    "CRITICAL": "#d32f2f",
+    "WARNING": "#f57c00",
+    "INFO": _DEFAULT_COLOR,
+    "SUCCESS": "#388e3c",
+}
+
+# Built once at import; only the dynamic fields are filled in per alert
+_HTML_TMPL = Template("""
+<html>
+    <body style="font-family: Arial, sans-serif;">
+        <div style="padding: 20px; background-color: #f5f5f5;">
+            <h2 style="color: $color;">
+                $emoji $level Alert
+            </h2>
+            <div style="background-color: white; padding: 15px; border-radius: 5px; margin-top: 10px;">
+                <pre style="white-space: pre-wrap; font-family: monospace;">$body</pre>
+            </div>
+            <p style="color: #666; font-size: 12px; margin-top: 20px;">
+                Sent by IT Operations Agent at $ts UTC
+            </p>
+        </div>
+    </body>
+</html>
+""")
+
+
+# -------------------------
+# SMTP Session
+# -------------------------
+
+class PipelinedSMTP(smtplib.SMTP):
+    """
+    SMTP client using the ESMTP PIPELINING extension (RFC 2920).
+    MAIL FROM, every RCPT TO and DATA are written back-to-back and their
+    replies read in one pass, so the envelope costs one round trip instead
+    of one per command. Falls back to plain smtplib if not advertised.
+    """
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        self.ehlo_or_helo_if_needed()
+        if not self.has_extn("pipelining"):
+            return super().sendmail(from_addr, to_addrs, msg, mail_options, rcpt_options)
+        
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+        if isinstance(msg, str):
+            msg = smtplib._fix_eols(msg).encode("ascii")
+        
+        mail_opts = list(mail_options)
+        if self.has_extn("size"):
+            mail_opts.append("size=%d" % len(msg))
+        mail_args = " ".join(["from:%s" % smtplib.quoteaddr(from_addr)] + mail_opts)
+        rcpt_suffix = "".join(" " + opt for opt in rcpt_options)
+        
+        # Write the whole envelope before reading any reply
+        self.putcmd("mail", mail_args)
+        for addr in to_addrs:
+            self.putcmd("rcpt", "to:%s%s" % (smtplib.quoteaddr(addr), rcpt_suffix))
+        self.putcmd("data")
+        
+        # Drain replies in the same order the commands were sent
+        mail_code, mail_resp = self.getreply()
+        refused = {}
+        for addr in to_addrs:
+            code, resp = self.getreply()
+            if code not in (250, 251):
+                refused[addr] = (code, resp)
+        data_code, data_resp = self.getreply()
+        
+        if data_code != 354:
+            if 421 in (mail_code, data_code):
+                self.close()
+            else:
+                self._rset()
+            if mail_code != 250:
+                raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+            if len(refused) == len(to_addrs):
+                raise smtplib.SMTPRecipientsRefused(refused)
+            raise smtplib.SMTPDataError(data_code, data_resp)
+        
+        if len(refused) == len(to_addrs):
+            # Server accepted DATA with no valid recipients - send an empty message
+            self.send(b"." + smtplib.bCRLF)
+            self.getreply()
+            raise smtplib.SMTPRecipientsRefused(refused)
+        
+        payload = smtplib._quote_periods(msg)
+        if payload[-2:] != smtplib.bCRLF:
+            payload += smtplib.bCRLF
+        self.send(payload + b"." + smtplib.bCRLF)
+        code, resp = self.getreply()
+        if code != 250:
+            if code == 421:
+                self.close()
+            else:
+                self._rset()
+            raise smtplib.SMTPDataError(code, resp)
+        return refused
+
+
+class _SMTPSession:
+    """
+    Long-lived SMTP connection shared by all alerts.
+    Avoids a fresh TCP + STARTTLS + LOGIN handshake per email.
+    """
+
+    def __init__(self):
+        self.server: Optional[PipelinedSMTP] = None
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def _connect(self):
+        server = PipelinedSMTP(SMTP_SERVER, SMTP_PORT, timeout=SMTP_TIMEOUT_SECONDS)
+        server.starttls()  # Secure connection
+        server.login(EMAIL_FROM, EMAIL_APP_PASSWORD)
+        self.server = server
+        self.count = 0
+
+    def _is_alive(self) -> bool:
+        if self.server is None:
+            return False
+        try:
+            return self.server.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _close(self):
+        if self.server is not None:
+            try:
+                self.server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+        self.server = None
+        self.count = 0
+
+    def send_message(self, msg: MIMEMultipart, recipients: List[str]):
+        """Send a message to all recipients, reconnecting if the connection went stale."""
+        with self.lock:
+            if not self._is_alive():
+                self._close()
+                self._connect()
+            payload = msg.as_string()
+            try:
+                self.server.sendmail(EMAIL_FROM, recipients, payload)
+            except (smtplib.SMTPServerDisconnected, OSError):
+                # Connection dropped between NOOP and send - retry once
+                self._close()
+                self._connect()
+                self.server.sendmail(EMAIL_FROM, recipients, payload)
+            self.count += 1
+            
+            # Recycle periodically to stay within provider rate limits
+            if self.count >= SMTP_MAX_MESSAGES_PER_CONNECTION:
+                self._close()
+
+    def close(self):
+        with self.lock:
+            self._close()
+
+
+_SESSION: Optional[_SMTPSession] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> _SMTPSession:
+    """Get the shared SMTP session (created lazily)."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                _SESSION = _SMTPSession()
+    return _SESSION
+
+
+def _close_session():
+    """Close the shared SMTP connection (registered with atexit)."""
+    if _SESSION is not None:
+        _SESSION.close()
+
+
+atexit.register(_close_session)
+
+
 # -------------------------
 # Email Sending Functions
 # -------------------------
 
+def _resolve_recipients(to_email: Optional[Union[str, List[str]]]) -> List[str]:
+    """Normalize a recipient override (or EMAIL_TO) into a list of addresses."""
+    recipients = to_email or EMAIL_TO or []
+    if isinstance(recipients, str):
+        recipients = recipients.split(",")
+    return [r.strip() for r in recipients if r and r.strip()]
+
+
+def _build_message(subject: str, body: str, alert_level: str, recipients: List[str], ts: str) -> MIMEMultipart:
+    """Build the HTML alert email for the given recipients."""
+    # Get alert emoji
+    emoji = _LEVEL_META.get(alert_level, _DEFAULT_LEVEL_META)[0]
+    subject_with_emoji = f"{emoji} {subject}"
+    
+    # Create message
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject_with_emoji
+    msg["From"] = EMAIL_FROM
+    msg["To"] = ", ".join(recipients)
+    
+    # Add body
+    html_body = _HTML_TMPL.substitute(
+        color=_COLOR_BY_LEVEL.get(alert_level, _DEFAULT_COLOR),
+        emoji=emoji,
+        level=alert_level,
+        body=html.escape(body),  # Body is plain text rendered inside <pre>
+        ts=ts,
+    )
+    
+    msg.attach(MIMEText(html_body, "html"))
+    return msg
+
+
 def send_email_alert(
     subject: str,
     body: str,
     alert_level: str = "INFO",
-    to_email: Optional[str] = None
+    to_email: Optional[Union[str, List[str]]] = None
 ) -> Dict[str, Any]:
     """
     Send an email alert using Gmail SMTP.
+    All recipients are delivered in a single SMTP transaction.
     
     Args:
         subject: Email subject line
-        body: Email body (plain text or HTML)
+        body: Email body (plain text, HTML-escaped into the template)
         alert_level: INFO, WARNING, or CRITICAL
-        to_email: Override recipient (default from config)
+        to_email: Override recipient(s) - address, comma-separated string,
+            or list (default from config)
     
     Returns:
         Result dictionary with success status
     """
+    now = datetime.utcnow()
+    
     try:
-        # Get alert emoji
-        emoji = ALERT_LEVELS.get(alert_level, {}).get("emoji", "📧")
-        subject_with_emoji = f"{emoji} {subject}"
-        
-        # Create message
-        msg = MIMEMultipart("alternative")
-        msg["Subject"] = subject_with_emoji
-        msg["From"] = EMAIL_FROM
-        msg["To"] = to_email or EMAIL_TO
-        
-        # Add body
-        html_body = f"""
-        <html>
-            <body style="font-family: Arial, sans-serif;">
-                <div style="padding: 20px; background-color: #f5f5f5;">
-                    <h2 style="color: {'#d32f2f' if alert_level == 'CRITICAL' else '#f57c00' if alert_level == 'WARNING' else '#1976d2'};">
-                        {emoji} {alert_level} Alert
-                    </h2>
-                    <div style="background-color: white; padding: 15px; border-radius: 5px; margin-top: 10px;">
-                        <pre style="white-space: pre-wrap; font-family: monospace;">{body}</pre>
-                    </div>
-                    <p style="color: #666; font-size: 12px; margin-top: 20px;">
-                        Sent by IT Operations Agent at {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
-                    </p>
-                </div>
-            </body>
-        </html>
-        """
+        recipients = _resolve_recipients(to_email)
+        msg = _build_message(subject, body, alert_level, recipients, now.strftime(_UTC_STRFTIME))
         
-        msg.attach(MIMEText(html_body, "html"))
-        
-        # Connect to Gmail SMTP
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls()  # Secure connection
-            server.login(EMAIL_FROM, EMAIL_APP_PASSWORD)
-            server.send_message(msg)
+        # Send over the shared Gmail SMTP connection
+        _get_session().send_message(msg, recipients)
         
         return {
             "success": True,
-            "message": f"Email sent to {to_email or EMAIL_TO}",
-            "timestamp": datetime.utcnow().isoformat()
+            "message": f"Email sent to {', '.join(recipients)}",
+            "timestamp": now.isoformat()
         }
         
     except Exception as e:
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now.isoformat()
         }
 
 
+def send_email_alerts_bulk(
+    alerts: List[Tuple[str, str, str]],
+    to_email: Optional[Union[str, List[str]]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Send several alerts back-to-back over the shared SMTP connection.
+    
+    Args:
+        alerts: List of (subject, body, alert_level) tuples
+        to_email: Override recipient(s) for every alert (default from config)
+    
+    Returns:
+        One result dictionary per alert, in input order
+    """
+    return [
+        send_email_alert(subject, body, alert_level, to_email)
+        for subject, body, alert_level in alerts
+    ]
+
+
+# -------------------------
+# Background Delivery
+# -------------------------
+
+# Alerts waiting to be emailed: (subject, body, alert_level)
+_ALERT_Q: "queue.Queue[Tuple[str, str, str]]" = queue.Queue(maxsize=ALERT_QUEUE_SIZE)
+
+
+def _smtp_worker():
+    """Drain the alert queue over the shared SMTP session."""
+    while True:
+        subject, body, alert_level = _ALERT_Q.get()
+        try:
+            result = send_email_alert(subject, body, alert_level)
+            if not result.get("success"):
+                print(f"⚠️  Alert email failed ({subject}): {result.get('error')}")
+        finally:
+            _ALERT_Q.task_done()
+
+
+def _enqueue_alert(subject: str, body: str, alert_level: str) -> Dict[str, Any]:
+    """Queue an alert for the background worker without blocking on SMTP."""
+    try:
+        _ALERT_Q.put_nowait((subject, body, alert_level))
+    except queue.Full:
+        print(f"⚠️  Alert queue full - dropping alert: {subject}")
+        return {
+            "success": False,
+            "error": "Alert queue full - alert dropped",
+            "alert_level": alert_level
+        }
+    
+    return {
+        "success": True,
+        "message": f"Alert queued (level {alert_level})",
+        "alert_level": alert_level
+    }
+
+
+def flush_alerts(timeout: float = ALERT_FLUSH_TIMEOUT_SECONDS) -> bool:
+    """
+    Wait for queued alerts to be sent.
+    
+    Returns:
+        True if the queue drained before the timeout
+    """
+    deadline = time.monotonic() + timeout
+    while _ALERT_Q.unfinished_tasks:
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.05)
+    return True
+
+
+threading.Thread(target=_smtp_worker, name="alert-smtp-worker", daemon=True).start()
+
+# Runs before _close_session (atexit is LIFO) so queued alerts go out first
+atexit.register(flush_alerts)
+
+
 # -------------------------
 # Alert Functions
 # -------------------------
@@ -105,11 +407,14 @@ def send_email_alert(
 def send_container_down_alert(container_name: str, auto_heal_result: Dict[str, Any]) -> Dict[str, Any]:
     """
     Send alert when a container goes down.
+    The email is queued and delivered by a background worker, so this
+    returns without waiting on SMTP.
     
     Args:
         container_name: Name of the failed container
         auto_heal_result: Result from incident response agent
     """
+    ts = datetime.utcnow().strftime(_UTC_STRFTIME)
     is_critical = container_name in CRITICAL_SERVICES
     alert_level = "CRITICAL" if is_critical else "WARNING"
     
@@ -128,7 +433,7 @@ Details:
 - Old Status: {auto_heal_result.get('old_status', 'unknown')}
 - New Status: {auto_heal_result.get('new_status', 'running')}
 - Restart Attempts: {auto_heal_result.get('attempts', 1)}
-- Timestamp: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
+- Timestamp: {ts} UTC
 
 No further action required. System is operational.
 """
@@ -157,13 +462,13 @@ Suggested Actions:
 3. Check host resources: disk space, memory
 4. Review application logs for errors
 
-Timestamp: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
+Timestamp: {ts} UTC
 """
         alert_level = "CRITICAL"
     
     # Check if we should send email for this alert level
-    if ALERT_LEVELS.get(alert_level, {}).get("send_email", True):
-        return send_email_alert(subject, body, alert_level)
+    if _LEVEL_META.get(alert_level, _DEFAULT_LEVEL_META)[1]:
+        return _enqueue_alert(subject, body, alert_level)
     else:
         # Log only, don't send email
         return {
@@ -178,11 +483,12 @@ def send_monitoring_summary(health_status: Dict[str, Any], healed_containers: li
     Send periodic monitoring summary email.
     """
     subject = "IT Ops Agent - Monitoring Summary"
+    ts = datetime.utcnow().strftime(_UTC_STRFTIME)
     
     body = f"""
 Monitoring Summary Report
 
-Timestamp: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')} UTC
+Timestamp: {ts} UTC
 
 Container Status:
 - Total Containers: {health_status.get('total', 0)}
@@ -7,38 +7,139 @@ Uses Docker API to detect container issues and provides intelligent insights.
 # Add project root to Python path
 import sys
 from pathlib import Path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-
-import json
-from typing import Any, Dict
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import re
+import threading
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime
 
 import docker
+import orjson
 from docker.errors import NotFound, APIError
 
 from langchain_ollama import ChatOllama
 from langchain.tools import tool
 from langchain_core.messages import HumanMessage, ToolMessage
 
+from config.config import OLLAMA_MODEL
+
 
 # -------------------------
 # Configuration
 # -------------------------
 
-OLLAMA_MODEL = "llama3.2:latest"
+# How long one container listing is shared between tool calls
+SNAPSHOT_TTL_SECONDS = 2
+
+# Upper bound on tool calls executed in parallel per LLM turn
+MAX_TOOL_WORKERS = 8
+
+# Keep-alive connections held open to the Docker daemon (docker-py default: 10)
+DOCKER_MAX_POOL_SIZE = 32
 
 
 # -------------------------
 # Docker Client
 # -------------------------
 
-def get_docker_client():
-    """Get Docker client connected to local Docker daemon."""
+_CLIENT = None
+_CLIENT_LOCK = threading.Lock()
+
+
+def _ping(client) -> bool:
+    """Check the cached client can still reach the daemon."""
     try:
-        return docker.from_env()
-    except Exception as e:
-        raise RuntimeError(f"Cannot connect to Docker. Is Docker Desktop running? Error: {e}")
+        return client.ping()
+    except Exception:
+        return False
+
+
+def get_docker_client():
+    """
+    Get Docker client connected to local Docker daemon.
+    The client is created once and reused across tool calls; creation and
+    reconnects happen under a lock so concurrent tool calls share one client.
+    """
+    global _CLIENT
+    client = _CLIENT
+    if client is not None and _ping(client):
+        return client
+    
+    with _CLIENT_LOCK:
+        # Another thread may have reconnected while we waited
+        if _CLIENT is None or not _ping(_CLIENT):
+            stale = _CLIENT
+            try:
+                _CLIENT = docker.from_env(max_pool_size=DOCKER_MAX_POOL_SIZE)
+            except Exception as e:
+                raise RuntimeError(f"Cannot connect to Docker. Is Docker Desktop running? Error: {e}")
+            if stale is not None:
+                try:
+                    stale.close()
+                except Exception:
+                    pass
+        return _CLIENT
+
+
+# -------------------------
+# Container Snapshot
+# -------------------------
+
+# Compact per-container row for the cached snapshot (a tuple, not a dict)
+_ContainerRow = namedtuple("_ContainerRow", "name id status image environment role exit_code")
+
+_EXIT_CODE_RE = re.compile(r"\((-?\d+)\)")
+
+
+def _exit_code(status_text: str) -> int:
+    """
+    Extract the exit code from a summary status like 'Exited (137) 2 hours ago'.
+    Created/running containers have no code in the text; State.ExitCode is 0 for them.
+    """
+    m = _EXIT_CODE_RE.search(status_text or "")
+    return int(m.group(1)) if m else 0
+
+
+@lru_cache(maxsize=1)
+def _snapshot_at(bucket: int) -> Tuple["_ContainerRow", ...]:
+    """Fetch all managed containers once; `bucket` only keys the cache."""
+    client = get_docker_client()
+    
+    # Low-level list returns summaries (state, image, labels) in one request,
+    # without the per-container inspect that containers.list() performs.
+    # Filter: Only containers with 'environment' label (applied by the daemon)
+    summaries = client.api.containers(all=True, filters={"label": "environment"})
+    
+    rows = []
+    for c in summaries:
+        labels = c.get("Labels") or {}
+        names = c.get("Names") or []
+        rows.append(_ContainerRow(
+            names[0].lstrip("/") if names else c["Id"][:12],
+            c["Id"][:12],
+            c.get("State", "unknown"),
+            c.get("Image") or "unknown",
+            labels.get("environment", "unknown"),
+            labels.get("role", "unknown"),
+            _exit_code(c.get("Status"))
+        ))
+    return tuple(rows)
+
+
+def _snapshot() -> Tuple["_ContainerRow", ...]:
+    """
+    Managed containers, shared by the listing tools.
+    Refreshed at most once per SNAPSHOT_TTL_SECONDS so several list-style
+    tool calls in one agent turn cost a single Docker API request.
+    """
+    return _snapshot_at(int(time.monotonic() // SNAPSHOT_TTL_SECONDS))
 
 
 # -------------------------
@@ -51,21 +152,15 @@ def list_all_containers() -> Dict[str, Any]:
     List all Docker containers with 'environment' label (managed containers only).
     Returns both running and stopped containers.
     """
-    client = get_docker_client()
-    all_containers = client.containers.list(all=True)
-    
-    # Filter: Only containers with 'environment' label
-    containers = [c for c in all_containers if 'environment' in c.labels]
-    
     result = []
-    for c in containers:
+    for c in _snapshot():
         result.append({
             "name": c.name,
-            "id": c.short_id,
+            "id": c.id,
             "status": c.status,  # running, exited, paused
-            "image": c.image.tags[0] if c.image.tags else "unknown",
-            "environment": c.labels.get("environment", "unknown"),
-            "role": c.labels.get("role", "unknown"),
+            "image": c.image,
+            "environment": c.environment,
+            "role": c.role,
             "health": "healthy" if c.status == "running" else "unhealthy"
         })
     
@@ -81,22 +176,17 @@ def list_running_containers() -> Dict[str, Any]:
     List only containers that are currently running.
     Only monitors containers with 'environment' label.
     """
-    client = get_docker_client()
-    all_containers = client.containers.list(filters={"status": "running"})
-    
-    # Filter: Only containers with 'environment' label
-    containers = [c for c in all_containers if 'environment' in c.labels]
-    
     result = []
-    for c in containers:
-        result.append({
-            "name": c.name,
-            "id": c.short_id,
-            "status": c.status,
-            "image": c.image.tags[0] if c.image.tags else "unknown",
-            "environment": c.labels.get("environment", "unknown"),
-            "role": c.labels.get("role", "unknown")
-        })
+    for c in _snapshot():
+        if c.status == "running":
+            result.append({
+                "name": c.name,
+                "id": c.id,
+                "status": c.status,
+                "image": c.image,
+                "environment": c.environment,
+                "role": c.role
+            })
     
     return {
         "total": len(result),
@@ -147,16 +237,24 @@ def get_container_logs(container_name: str, lines: int = 20) -> Dict[str, Any]:
     except NotFound:
         return {"error": f"Container '{container_name}' not found"}
     
+    # Stream into a bounded buffer instead of materializing the whole blob
+    buf = deque(maxlen=lines)
+    pending = b""
     try:
-        logs = container.logs(tail=lines, timestamps=True).decode('utf-8').strip()
-        log_lines = logs.split('\n') if logs else []
+        for chunk in container.logs(tail=lines, timestamps=True, stream=True, follow=False):
+            pending += chunk
+            *complete, pending = pending.split(b"\n")
+            for line in complete:
+                buf.append(line.decode('utf-8'))
+        if pending.strip():
+            buf.append(pending.decode('utf-8'))
     except Exception as e:
         return {"error": f"Could not retrieve logs: {str(e)}"}
     
     return {
         "container": container_name,
-        "log_count": len(log_lines),
-        "logs": log_lines[-lines:]  # Last N lines
+        "log_count": len(buf),
+        "logs": list(buf)  # Last N lines
     }
 
 
@@ -166,11 +264,7 @@ def check_unhealthy_containers() -> Dict[str, Any]:
     Quick check to find all unhealthy (stopped/exited) containers.
     Returns list of containers that need attention.
     """
-    client = get_docker_client()
-    all_containers = client.containers.list(all=True)
-    
-    # Filter: Only containers with 'environment' label
-    containers = [c for c in all_containers if 'environment' in c.labels]
+    containers = _snapshot()
     
     unhealthy = []
     for c in containers:
@@ -178,10 +272,10 @@ def check_unhealthy_containers() -> Dict[str, Any]:
             unhealthy.append({
                 "name": c.name,
                 "status": c.status,
-                "image": c.image.tags[0] if c.image.tags else "unknown",
-                "environment": c.labels.get("environment", "unknown"),
-                "role": c.labels.get("role", "unknown"),
-                "exit_code": c.attrs['State'].get('ExitCode', 'N/A')
+                "image": c.image,
+                "environment": c.environment,
+                "role": c.role,
+                "exit_code": c.exit_code
             })
     
     return {
@@ -206,6 +300,9 @@ TOOLS = [
 
 TOOL_MAP = {t.name: t for t in TOOLS}
 
+# Bound invoke methods, so dispatch is a single dict lookup
+_TOOL_INVOKE = {t.name: t.invoke for t in TOOLS}
+
 
 # -------------------------
 # System Prompt
@@ -235,15 +332,95 @@ Available tools:
 - check_unhealthy_containers: Find all containers that are down or unhealthy
 """
 
+_QUESTION_PREFIX = SYSTEM_PROMPT + "\n\nUser question: "
+
+
+# -------------------------
+# Fast Paths (no LLM)
+# -------------------------
+
+def _format_unhealthy(out: Dict[str, Any]) -> str:
+    if out["all_healthy"]:
+        return f"All {out['total_checked']} managed containers are running and healthy."
+    lines = [f"{out['unhealthy_count']} of {out['total_checked']} managed containers need attention:"]
+    for c in out["unhealthy_containers"]:
+        lines.append(f"- {c['name']} ({c['role']}): {c['status']}, exit code {c['exit_code']}")
+    lines.append("Recommend notifying the incident response team.")
+    return "\n".join(lines)
+
+
+def _format_container_list(out: Dict[str, Any]) -> str:
+    lines = [f"{out['total']} container(s):"]
+    for c in out["containers"]:
+        lines.append(f"- {c['name']} ({c['role']}, {c['image']}): {c['status']}")
+    return "\n".join(lines)
+
+
+# Canonical questions whose answer is a pure function of one tool's output
+_FAST_PATHS = [
+    (re.compile(r"^\s*(are\s+)?all\s+(the\s+)?containers\s+healthy\s*\??\s*$", re.I),
+     check_unhealthy_containers, _format_unhealthy),
+    (re.compile(r"^\s*which\s+containers\s+need\s+attention\s*\??\s*$", re.I),
+     check_unhealthy_containers, _format_unhealthy),
+    (re.compile(r"^\s*list\s+(all\s+)?running\s+containers\s*\.?\s*$", re.I),
+     list_running_containers, _format_container_list),
+    (re.compile(r"^\s*list\s+all\s+containers\s*\.?\s*$", re.I),
+     list_all_containers, _format_container_list),
+]
+
+
+def _try_fast_path(question: str) -> Optional[str]:
+    """Answer canonical questions directly from a tool, skipping the LLM."""
+    for pattern, tool_fn, formatter in _FAST_PATHS:
+        if pattern.match(question):
+            return formatter(tool_fn.invoke({}))
+    return None
+
 
 # -------------------------
 # Agent Function
 # -------------------------
 
+@lru_cache(maxsize=1)
+def _get_llm():
+    """Chat model with TOOLS bound, built once (tool schemas never change)."""
+    return ChatOllama(model=OLLAMA_MODEL, temperature=0).bind_tools(TOOLS)
+
+
+def _run_tool_call(call: Dict[str, Any]) -> Tuple[Any, Any]:
+    """Execute one LLM tool call, returning (tool_call_id, tool output)."""
+    tool_name = call["name"]
+    tool_args = call.get("args", {}) or {}
+    
+    fn = _TOOL_INVOKE.get(tool_name)
+    if fn is None:
+        tool_out = {"error": f"Unknown tool: {tool_name}"}
+    else:
+        try:
+            tool_out = fn(tool_args)
+        except Exception as e:
+            tool_out = {"error": str(e)}
+    
+    return call.get("id"), tool_out
+
+
+def _run_tool_calls(tool_calls: List[Dict[str, Any]]) -> List[ToolMessage]:
+    """Execute all requested tools concurrently (each is an independent Docker call)."""
+    with ThreadPoolExecutor(max_workers=min(MAX_TOOL_WORKERS, len(tool_calls))) as ex:
+        results = list(ex.map(_run_tool_call, tool_calls))
+    
+    # Tool results go back to the LLM in the original call order
+    return [
+        ToolMessage(content=orjson.dumps(tool_out).decode(), tool_call_id=tool_call_id)
+        for tool_call_id, tool_out in results
+    ]
+
+
 def monitor_containers(question: str, max_iterations: int = 3) -> str:
     """
     Docker monitoring agent using LLM-based analysis.
     Monitors real Docker containers and provides intelligent insights.
+    Canonical questions (see _FAST_PATHS) are answered without calling the LLM.
     
     Args:
         question: Natural language question about container status
@@ -258,8 +435,12 @@ def monitor_containers(question: str, max_iterations: int = 3) -> str:
         - "Show me logs from the database"
         - "List all running containers"
     """
-    llm = ChatOllama(model=OLLAMA_MODEL, temperature=0).bind_tools(TOOLS)
-    messages = [HumanMessage(content=SYSTEM_PROMPT + "\n\nUser question: " + question)]
+    fast_answer = _try_fast_path(question)
+    if fast_answer is not None:
+        return fast_answer
+    
+    llm = _get_llm()
+    messages = [HumanMessage(content=_QUESTION_PREFIX + question)]
     
     for iteration in range(max_iterations):
         ai = llm.invoke(messages)
@@ -268,34 +449,51 @@ def monitor_containers(question: str, max_iterations: int = 3) -> str:
         if not getattr(ai, "tool_calls", None):
             return ai.content.strip()
         
-        # Execute all requested tools
-        for call in ai.tool_calls:
-            tool_name = call["name"]
-            tool_args = call.get("args", {}) or {}
-            tool_call_id = call.get("id")
-            
-            if tool_name not in TOOL_MAP:
-                tool_out = {"error": f"Unknown tool: {tool_name}"}
-            else:
-                try:
-                    tool_out = TOOL_MAP[tool_name].invoke(tool_args)
-                except Exception as e:
-                    tool_out = {"error": str(e)}
-            
-            # Send tool result back to LLM
-            messages.append(ToolMessage(
-                content=json.dumps(tool_out),
-                tool_call_id=tool_call_id
-            ))
-        
-        # Add AI message to maintain conversation structure
-        messages.insert(-len(ai.tool_calls), ai)
+        # Add AI message first to maintain conversation structure
+        messages.append(ai)
+        messages.extend(_run_tool_calls(ai.tool_calls))
     
     # If max iterations reached, ask LLM for final answer
     final = llm.invoke(messages)
     return final.content.strip()
 
 
+def monitor_containers_stream(question: str, max_iterations: int = 3) -> Iterator[str]:
+    """
+    Streaming variant of monitor_containers().
+    Tool-calling turns are consumed silently; answer text is yielded as the
+    LLM generates it, so callers can print from the first token.
+    
+    Args:
+        question: Natural language question about container status
+        max_iterations: Maximum tool calling iterations
+    
+    Yields:
+        Chunks of the natural language response
+    """
+    fast_answer = _try_fast_path(question)
+    if fast_answer is not None:
+        yield fast_answer
+        return
+    
+    llm = _get_llm()
+    messages = [HumanMessage(content=_QUESTION_PREFIX + question)]
+    
+    # The extra pass is the final answer once max_iterations is reached
+    for iteration in range(max_iterations + 1):
+        ai = None
+        for chunk in llm.stream(messages):
+            ai = chunk if ai is None else ai + chunk
+            if chunk.content and not ai.tool_call_chunks:
+                yield chunk.content
+        
+        if ai is None or not ai.tool_calls or iteration == max_iterations:
+            return
+        
+        messages.append(ai)
+        messages.extend(_run_tool_calls(ai.tool_calls))
+
+
 # -------------------------
 # Direct Functions (for orchestrator if needed)
 # -------------------------
@@ -7,57 +7,124 @@ Can analyze incidents and choose appropriate healing actions.
 # Add project root to Python path
 import sys
 from pathlib import Path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
+import atexit
 import json
+import random
+import re
+import threading
 import time
-from typing import Any, Dict, List
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
 from datetime import datetime, timezone
 
 import docker
 from docker.errors import NotFound, APIError
 
+try:
+    import orjson
+except ImportError:  # Falls back to stdlib json
+    orjson = None
+
 from langchain_ollama import ChatOllama
 from langchain.tools import tool
 from langchain_core.messages import HumanMessage, ToolMessage
 
-from config.config import MAX_RESTART_ATTEMPTS, RESTART_TIMEOUT_SECONDS
+from config.config import (
+    MAX_RESTART_ATTEMPTS,
+    RESTART_TIMEOUT_SECONDS,
+    MAX_PARALLEL_RESTARTS,
+    OLLAMA_MODEL
+)
 
 
 # -------------------------
-# Configuration
+# Docker Client
 # -------------------------
 
-OLLAMA_MODEL = "llama3.2:latest"
+_DOCKER_CLIENT: Optional[docker.DockerClient] = None
+_DOCKER_LOCK = threading.Lock()
 
 
-# -------------------------
-# Docker Client
-# -------------------------
+def get_docker_client() -> docker.DockerClient:
+    """Get Docker client (created once, shared by all tools)."""
+    global _DOCKER_CLIENT
+    if _DOCKER_CLIENT is None:
+        with _DOCKER_LOCK:
+            if _DOCKER_CLIENT is None:
+                try:
+                    _DOCKER_CLIENT = docker.from_env()
+                except Exception as e:
+                    raise RuntimeError(f"Cannot connect to Docker: {e}")
+    return _DOCKER_CLIENT
 
-def get_docker_client():
-    """Get Docker client."""
-    try:
-        return docker.from_env()
-    except Exception as e:
-        raise RuntimeError(f"Cannot connect to Docker: {e}")
+
+def close_docker_client():
+    """Close the shared Docker client (call at shutdown)."""
+    global _DOCKER_CLIENT
+    with _DOCKER_LOCK:
+        if _DOCKER_CLIENT is not None:
+            _DOCKER_CLIENT.close()
+            _DOCKER_CLIENT = None
+
+
+atexit.register(close_docker_client)
 
 
 # -------------------------
-# Core Healing Tools (for LLM)
+# Core Healing Logic
 # -------------------------
 
-@tool
-def restart_container_with_retry(container_name: str, max_attempts: int = MAX_RESTART_ATTEMPTS) -> Dict[str, Any]:
+def _utc_timestamp() -> str:
+    """Current UTC time to the second; microseconds only bloat the LLM prompt."""
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def _retry_backoff(attempt: int) -> float:
+    """Exponential backoff with jitter between restart attempts: ~0.2s, 0.4s, 0.8s... capped at 2s."""
+    return min(0.2 * (2 ** (attempt - 1)) + random.uniform(0, 0.1), 2.0)
+
+
+def _restart_and_wait_for_start(client: docker.DockerClient, container) -> str:
     """
-    Restart a container with retry logic.
-    Attempts multiple restarts if the first one fails.
+    Restart a container and wait for the daemon's 'start' event.
+    
+    The event subscription is opened before the restart so the event
+    cannot be missed, and the daemon closes the stream at the deadline.
     
     Args:
-        container_name: Name of the container to restart
-        max_attempts: Maximum number of restart attempts
+        client: Docker client
+        container: Container to restart
+    
+    Returns:
+        Container status after the restart
     """
+    now = int(time.time())
+    events = client.api.events(
+        decode=True,
+        since=now,
+        until=now + RESTART_TIMEOUT_SECONDS * 2,
+        filters={"container": container.id, "event": "start"}
+    )
+    try:
+        container.restart(timeout=RESTART_TIMEOUT_SECONDS)
+        for event in events:
+            if event.get("status") == "start" or event.get("Action") == "start":
+                return "running"
+    finally:
+        events.close()
+    
+    # No start event before the deadline: report what the daemon says now
+    return client.api.inspect_container(container.id)["State"]["Status"]
+
+
+def _restart_container_with_retry_impl(container_name: str, max_attempts: int = MAX_RESTART_ATTEMPTS) -> Dict[str, Any]:
+    """Restart implementation shared by the LLM tool and the direct functions."""
     client = get_docker_client()
     
     try:
@@ -74,15 +141,13 @@ def restart_container_with_retry(container_name: str, max_attempts: int = MAX_RE
     
     for attempt in range(1, max_attempts + 1):
         try:
-            container.restart(timeout=RESTART_TIMEOUT_SECONDS)
-            container.reload()
-            
-            if container.status == "running":
+            new_status = _restart_and_wait_for_start(client, container)
+            if new_status == "running":
                 return {
                     "success": True,
                     "container": container_name,
                     "old_status": old_status,
-                    "new_status": container.status,
+                    "new_status": new_status,
                     "attempts": attempt,
                     "message": f"Successfully restarted after {attempt} attempt(s)"
                 }
@@ -96,7 +161,9 @@ def restart_container_with_retry(container_name: str, max_attempts: int = MAX_RE
                     "attempts": attempt,
                     "message": f"Failed after {attempt} attempts"
                 }
-            time.sleep(2)
+        
+        if attempt < max_attempts:
+            time.sleep(_retry_backoff(attempt))
     
     return {
         "success": False,
@@ -105,36 +172,56 @@ def restart_container_with_retry(container_name: str, max_attempts: int = MAX_RE
     }
 
 
-@tool
-def check_container_health_status() -> Dict[str, Any]:
+@dataclass(slots=True, frozen=True)
+class ContainerState:
+    """One managed container as seen by the direct health check."""
+    name: str
+    status: str
+    image: str = "unknown"
+    environment: str = "unknown"
+    role: str = "unknown"
+
+
+def _check_container_health_status_impl(make_row: Callable[..., Any] = dict) -> Dict[str, Any]:
     """
-    Quick health check of containers with 'environment' label.
-    Returns summary without taking action.
+    Health check implementation shared by the LLM tool and the direct functions.
+    
+    Args:
+        make_row: Per-container constructor, called with keyword fields
+            (dict for JSON-bound tool output, ContainerState for direct callers)
     """
     client = get_docker_client()
     
-    all_containers = client.containers.list(all=True)
-    containers = [c for c in all_containers if 'environment' in c.labels]
+    # Only containers with 'environment' label (filtered by the daemon)
+    containers = client.containers.list(all=True, filters={"label": "environment"})
     
     running = []
     stopped = []
+    running_append = running.append
+    stopped_append = stopped.append
     
     for container in containers:
-        info = {
-            "name": container.name,
-            "status": container.status,
-            "image": container.image.tags[0] if container.image.tags else "unknown",
-            "environment": container.labels.get("environment", "unknown"),
-            "role": container.labels.get("role", "unknown")
-        }
+        # Read everything from the already-fetched inspect data; avoids the
+        # extra image lookup that container.image performs
+        attrs = container.attrs
+        config = attrs["Config"]
+        labels = config.get("Labels") or {}
+        status = attrs["State"]["Status"]
+        info = make_row(
+            name=container.name,
+            status=status,
+            image=config.get("Image") or "unknown",
+            environment=labels.get("environment", "unknown"),
+            role=labels.get("role", "unknown")
+        )
         
-        if container.status == "running":
-            running.append(info)
+        if status == "running":
+            running_append(info)
         else:
-            stopped.append(info)
+            stopped_append(info)
     
     return {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _utc_timestamp(),
         "total": len(containers),
         "running": len(running),
         "stopped": len(stopped),
@@ -144,6 +231,32 @@ def check_container_health_status() -> Dict[str, Any]:
     }
 
 
+# -------------------------
+# LLM Tool Wrappers
+# -------------------------
+
+@tool
+def restart_container_with_retry(container_name: str, max_attempts: int = MAX_RESTART_ATTEMPTS) -> Dict[str, Any]:
+    """
+    Restart a container with retry logic.
+    Attempts multiple restarts if the first one fails.
+    
+    Args:
+        container_name: Name of the container to restart
+        max_attempts: Maximum number of restart attempts
+    """
+    return _restart_container_with_retry_impl(container_name, max_attempts)
+
+
+@tool
+def check_container_health_status() -> Dict[str, Any]:
+    """
+    Quick health check of containers with 'environment' label.
+    Returns summary without taking action.
+    """
+    return _check_container_health_status_impl()
+
+
 # -------------------------
 # Tool Registry
 # -------------------------
@@ -156,6 +269,115 @@ TOOLS = [
 TOOL_MAP = {t.name: t for t in TOOLS}
 
 
+# -------------------------
+# LLM Client
+# -------------------------
+
+@lru_cache(maxsize=1)
+def _get_llm():
+    """Chat model with TOOLS bound, built once and reused across incidents."""
+    return ChatOllama(model=OLLAMA_MODEL, temperature=0).bind_tools(TOOLS)
+
+
+def warmup() -> bool:
+    """
+    Send a 1-token prompt so Ollama loads the model weights before the
+    first real incident. Returns False if Ollama is unreachable.
+    """
+    try:
+        ChatOllama(model=OLLAMA_MODEL, temperature=0, num_predict=1).invoke("ping")
+        return True
+    except Exception:
+        return False
+
+
+def _has_complete_tool_call(message) -> bool:
+    """True once a streamed message holds a tool call with a name and fully-formed JSON args."""
+    for chunk in getattr(message, "tool_call_chunks", None) or []:
+        if not chunk.get("name"):
+            continue
+        args = chunk.get("args")
+        if isinstance(args, dict):
+            return True
+        # A name with empty args is just the first chunk of a streamed call
+        if not args:
+            continue
+        try:
+            if isinstance(json.loads(args), dict):
+                return True
+        except ValueError:
+            continue
+    return False
+
+
+def _invoke_until_tool_call(llm, messages):
+    """
+    Stream the LLM response and stop as soon as a complete tool call arrives,
+    skipping the trailing explanation we don't use. Falls back to invoke()
+    if the provider can't stream.
+    """
+    gathered = None
+    try:
+        stream = llm.stream(messages)
+    except NotImplementedError:
+        return llm.invoke(messages)
+    
+    try:
+        for chunk in stream:
+            gathered = chunk if gathered is None else gathered + chunk
+            if _has_complete_tool_call(gathered):
+                break
+    except NotImplementedError:
+        return llm.invoke(messages)
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()  # Cancel the rest of the generation
+    
+    return gathered if gathered is not None else llm.invoke(messages)
+
+
+# -------------------------
+# Deterministic Routing
+# -------------------------
+
+_CLASSIFY_RE = re.compile(
+    r"(?P<down>\b(?P<name>[a-z0-9][a-z0-9_.\-]*)\s+(is\s+down|crashed|is\s+unhealthy)\b)"
+    r"|(?P<health>\bcheck\b.*\bhealth)",
+    re.I
+)
+
+
+def _route_without_llm(issue_description: str) -> Optional[Dict[str, Any]]:
+    """
+    Handle trivially routable incidents ("<name> is down", "check ... health").
+    Returns None when the LLM should decide instead.
+    """
+    m = _CLASSIFY_RE.search(issue_description)
+    if m is None:
+        return None
+    
+    if m.group("down"):
+        container_name = m.group("name")
+        result = heal_container(container_name)
+        if result.get("error") == "Container not found":
+            # Not a container name (e.g. "Database container crashed") - let the LLM decide
+            return None
+        return {
+            "action": "restart_container_with_retry",
+            "result": result,
+            "llm_used": False,
+            "reasoning": f"Matched '{container_name}' as a down container; restarted directly"
+        }
+    
+    return {
+        "action": "check_container_health_status",
+        "result": _check_container_health_status_impl(),
+        "llm_used": False,
+        "reasoning": "Matched a health-check request; checked directly"
+    }
+
+
 # -------------------------
 # LLM-Based Incident Response Agent
 # -------------------------
@@ -164,6 +386,7 @@ def incident_response_agent(issue_description: str) -> Dict[str, Any]:
     """
     LLM-based Incident Response Agent.
     Analyzes incidents and decides what action to take.
+    Literal requests are routed directly and skip the LLM (llm_used=False).
     
     Args:
         issue_description: Natural language description of the incident
@@ -175,7 +398,12 @@ def incident_response_agent(issue_description: str) -> Dict[str, Any]:
     Returns:
         Dict with action taken and results
     """
-    llm = ChatOllama(model=OLLAMA_MODEL, temperature=0).bind_tools(TOOLS)
+    # Literal intents are routed directly, without an LLM turn
+    routed = _route_without_llm(issue_description)
+    if routed is not None:
+        return routed
+    
+    llm = _get_llm()
     
     system_prompt = """You are an Incident Response Agent for Docker infrastructure.
 
@@ -194,8 +422,8 @@ Guidelines:
     
     messages = [HumanMessage(content=system_prompt + "\n\nIncident: " + issue_description)]
     
-    # Let LLM decide what to do
-    ai = llm.invoke(messages)
+    # Let LLM decide what to do (stops decoding once a tool call is complete)
+    ai = _invoke_until_tool_call(llm, messages)
     
     if not getattr(ai, "tool_calls", None):
         return {
@@ -210,7 +438,11 @@ Guidelines:
     tool_args = call.get("args", {}) or {}
     
     if tool_name in TOOL_MAP:
-        result = TOOL_MAP[tool_name].invoke(tool_args)
+        # Bad LLM args (e.g. a missing container_name) fail pydantic validation
+        try:
+            result = TOOL_MAP[tool_name].invoke(tool_args)
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
         return {
             "action": tool_name,
             "result": result,
@@ -227,10 +459,10 @@ Guidelines:
 
 def get_health_status() -> Dict[str, Any]:
     """
-    Direct health check (no LLM).
-    Fast path for orchestrator.
+    Direct health check (no LLM, no langchain tool dispatch).
+    Fast path for orchestrator; container entries are ContainerState objects.
     """
-    return check_container_health_status.invoke({})
+    return _check_container_health_status_impl(ContainerState)
 
 
 def heal_container(container_name: str) -> Dict[str, Any]:
@@ -238,7 +470,43 @@ def heal_container(container_name: str) -> Dict[str, Any]:
     Direct container healing (no LLM).
     Fast path for orchestrator when action is already determined.
     """
-    return restart_container_with_retry.invoke({"container_name": container_name})
+    return _restart_container_with_retry_impl(container_name)
+
+
+# Every state heal_all_containers treats as needing a restart
+NON_RUNNING_STATUSES = ["created", "restarting", "paused", "exited", "dead"]
+
+
+def _summary_name(summary: Dict[str, Any]) -> str:
+    """Container name from a low-level list summary ('/prod-web-01' -> 'prod-web-01')."""
+    names = summary.get("Names") or []
+    return names[0].lstrip("/") if names else summary["Id"][:12]
+
+
+def _heal_one_safely(container_name: str) -> Dict[str, Any]:
+    """Heal one container for a batch; a Docker error fails only this entry."""
+    try:
+        return _restart_container_with_retry_impl(container_name)
+    except Exception as e:
+        return {"success": False, "error": str(e), "attempts": 0}
+
+
+def heal_containers(container_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Restart the given containers concurrently (no LLM).
+    Restarts are I/O-bound on the daemon, so they run in a bounded pool.
+    
+    Args:
+        container_names: Names of the containers to heal
+    
+    Returns:
+        Dict mapping each container name to its heal result, in input order
+    """
+    if not container_names:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_RESTARTS, len(container_names))) as ex:
+        results = ex.map(_heal_one_safely, container_names)
+        return dict(zip(container_names, results))
 
 
 def heal_all_containers() -> Dict[str, Any]:
@@ -248,26 +516,27 @@ def heal_all_containers() -> Dict[str, Any]:
     """
     client = get_docker_client()
     
-    all_containers = client.containers.list(all=True)
-    containers = [c for c in all_containers if 'environment' in c.labels]
+    # Let the daemon split managed containers by state; only names are needed,
+    # so the low-level summaries avoid a per-container inspect
+    running = client.api.containers(filters={"label": "environment", "status": "running"})
+    stopped = client.api.containers(
+        all=True,
+        filters={"label": "environment", "status": NON_RUNNING_STATUSES}
+    )
     
     healed = []
-    already_healthy = []
+    already_healthy = [{"name": _summary_name(c), "status": "running"} for c in running]
     failed_healing = []
     
-    for container in containers:
-        if container.status == "running":
-            already_healthy.append({"name": container.name, "status": "running"})
+    for result in heal_containers([_summary_name(c) for c in stopped]).values():
+        if result.get("success"):
+            healed.append(result)
         else:
-            result = restart_container_with_retry.invoke({"container_name": container.name})
-            if result.get("success"):
-                healed.append(result)
-            else:
-                failed_healing.append(result)
+            failed_healing.append(result)
     
     return {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-        "total_containers": len(containers),
+        "timestamp": _utc_timestamp(),
+        "total_containers": len(running) + len(stopped),
         "healthy_count": len(already_healthy),
         "healed_count": len(healed),
         "failed_count": len(failed_healing),
@@ -282,6 +551,13 @@ def heal_all_containers() -> Dict[str, Any]:
 # Testing
 # -------------------------
 
+def _pretty_json(obj: Any) -> str:
+    """Indented JSON for console output."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2, default=asdict)
+
+
 if __name__ == "__main__":
     print("=" * 80)
     print("🚨 INCIDENT RESPONSE AGENT TEST")
@@ -290,23 +566,23 @@ if __name__ == "__main__":
     # Test 1: Direct health check (no LLM)
     print("\n[TEST 1] Direct Health Check (no LLM)...")
     health = get_health_status()
-    print(json.dumps(health, indent=2))
+    print(_pretty_json(health))
     
     # Test 2: LLM-based incident response
     print("\n[TEST 2] LLM-Based Incident Analysis...")
     if health['stopped'] > 0:
-        container_name = health['stopped_containers'][0]['name']
+        container_name = health['stopped_containers'][0].name
         result = incident_response_agent(f"{container_name} is down, please fix it")
-        print(json.dumps(result, indent=2))
+        print(_pretty_json(result))
     else:
         result = incident_response_agent("Check all container health status")
-        print(json.dumps(result, indent=2))
+        print(_pretty_json(result))
     
     # Test 3: Direct heal all (no LLM)
     if health['stopped'] > 0:
         print("\n[TEST 3] Direct Heal All (no LLM)...")
         result = heal_all_containers()
-        print(json.dumps(result, indent=2))
+        print(_pretty_json(result))
     
     print("\n" + "=" * 80)
     print("✅ Tests Complete")
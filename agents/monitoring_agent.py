@@ -1,42 +1,176 @@
+# Add project root to Python path
+import sys
+from pathlib import Path
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
 import json
 import re
+import threading
+import time
 import requests
-from typing import Any, Dict, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # Falls back to stdlib json
+    orjson = None
 
 from langchain_ollama import ChatOllama
 from langchain.tools import tool
-from langchain_core.messages import HumanMessage, ToolMessage
+from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
+
+# Model tags must match EXACTLY what `ollama list` shows (see config.py)
+from config.config import OLLAMA_MODEL, OLLAMA_FINAL_ANSWER_MODEL
 
 MONITORING_API_URL = "http://localhost:8001"
 
-# IMPORTANT: set this to EXACTLY what `ollama list` shows (e.g. "llama3:latest")
-OLLAMA_MODEL = "llama3.2:latest"
+
+# -------------------------
+# HTTP Session
+# -------------------------
+
+# One pooled session so tool calls reuse TCP connections to the monitoring API
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=2, backoff_factor=0.1),
+))
 
 
 # -------------------------
 # Helpers
 # -------------------------
 
+_HOSTNAME_KV_RE = re.compile(r"hostname\s*=\s*['\"]?([A-Za-z0-9\-_.]+)['\"]?")
+_HOSTNAME_RE = re.compile(r"([A-Za-z0-9\-_.]+)")
+
+
 def _extract_hostname(value: str) -> str:
     """Extract a hostname like PRD-APP-01 from messy text such as hostname='PRD-APP-01'."""
     if value is None:
         return ""
     s = str(value).strip()
 
+    # Fast path: already a clean hostname (the common case), no regex needed
+    if "=" not in s:
+        bare = s.strip("\"'")
+        if bare.isascii() and bare.replace("-", "").replace("_", "").replace(".", "").isalnum():
+            return bare
+
     # hostname="PRD-APP-01" / hostname = 'PRD-APP-01'
-    m = re.search(r"hostname\s*=\s*['\"]?([A-Za-z0-9\-_.]+)['\"]?", s)
+    m = _HOSTNAME_KV_RE.search(s)
     if m:
         return m.group(1)
 
     # "PRD-APP-01" -> PRD-APP-01
     s = s.strip("\"'")
-    m2 = re.search(r"([A-Za-z0-9\-_.]+)", s)
+    m2 = _HOSTNAME_RE.search(s)
     return m2.group(1) if m2 else s
 
 
+# Hard cap on any single serialized tool result resent to the LLM
+MAX_TOOL_RESULT_CHARS = 2048
+
+# Cap on log text per tool result (prompt size drives prefill time), derived
+# from the result cap with headroom for the JSON envelope and per-line quoting
+MAX_LOG_CHARS = MAX_TOOL_RESULT_CHARS - 256
+
+
+def _trim_logs(obj: Any) -> Any:
+    """Trim a tool result's `logs` array to MAX_LOG_CHARS of text."""
+    if isinstance(obj, dict) and isinstance(obj.get("logs"), list):
+        kept, used = [], 0
+        for line in obj["logs"]:
+            used += len(line)
+            if used > MAX_LOG_CHARS:
+                break
+            kept.append(line)
+        if len(kept) < len(obj["logs"]):
+            return {**obj, "logs": kept, "logs_truncated": True}
+    return obj
+
+
+def _compact_json(obj: Any) -> str:
+    """Serialize for the LLM: no whitespace (humans don't read this)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def _fit_tool_result(obj: Any) -> str:
+    """
+    Serialize a tool result for the LLM within MAX_TOOL_RESULT_CHARS.
+    Oversized results are cut at item boundaries (trailing `logs`/`servers`
+    entries are dropped and `"truncated": true` is added), so the model
+    always receives valid JSON.
+    """
+    obj = _trim_logs(obj)
+    text = _compact_json(obj)
+    if len(text) <= MAX_TOOL_RESULT_CHARS or not isinstance(obj, dict):
+        return text
+
+    list_key = next((k for k in ("logs", "servers") if isinstance(obj.get(k), list)), None)
+    if list_key is not None:
+        items = list(obj[list_key])
+        while items:
+            items.pop()
+            text = _compact_json({**obj, list_key: items, "truncated": True})
+            if len(text) <= MAX_TOOL_RESULT_CHARS:
+                return text
+
+    # Nothing to shorten item by item: keep the scalar fields only
+    scalars = {k: v for k, v in obj.items() if not isinstance(v, (dict, list))}
+    return _compact_json({**scalars, "truncated": True})
+
+
 def _safe_get(url: str, *, params: Optional[dict] = None, timeout: int = 10):
-    """HTTP GET wrapper with timeout."""
-    return requests.get(url, params=params, timeout=timeout)
+    """HTTP GET wrapper with timeout (reuses pooled keep-alive connections)."""
+    return _SESSION.get(url, params=params, timeout=timeout)
+
+
+# -------------------------
+# Short-TTL response cache
+# -------------------------
+
+# Status/metrics barely change within seconds; follow-up questions about the
+# same host reuse the last response instead of re-querying the API.
+CACHE_TTL_SECONDS = 5
+CACHE_MAX_ENTRIES = 512
+
+_CACHE: Dict[Tuple[str, str], Tuple[float, Any]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _get_server_json_cached(host: str, endpoint: str) -> Dict[str, Any]:
+    """GET /servers/{host}/{endpoint}, cached for CACHE_TTL_SECONDS (errors are not cached)."""
+    key = (endpoint, host)
+    now = time.monotonic()
+    with _CACHE_LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None and now - hit[0] < CACHE_TTL_SECONDS:
+            return hit[1]
+
+    r = _safe_get(f"{MONITORING_API_URL}/servers/{host}/{endpoint}")
+    if r.status_code == 404:
+        return {"error": f"Server '{host}' not found."}
+    r.raise_for_status()
+    data = r.json()
+
+    with _CACHE_LOCK:
+        if len(_CACHE) >= CACHE_MAX_ENTRIES:
+            for k in [k for k, (t, _) in _CACHE.items() if now - t >= CACHE_TTL_SECONDS]:
+                del _CACHE[k]
+            if len(_CACHE) >= CACHE_MAX_ENTRIES:
+                _CACHE.clear()
+        _CACHE[key] = (now, data)
+    return data
 
 
 # -------------------------
@@ -47,11 +181,7 @@ def _safe_get(url: str, *, params: Optional[dict] = None, timeout: int = 10):
 def get_server_status(hostname: str) -> Dict[str, Any]:
     """Get server health/status for the given hostname (example: PRD-APP-01)."""
     host = _extract_hostname(hostname)
-    r = _safe_get(f"{MONITORING_API_URL}/servers/{host}/status")
-    if r.status_code == 404:
-        return {"error": f"Server '{host}' not found."}
-    r.raise_for_status()
-    return r.json()
+    return _get_server_json_cached(host, "status")
 
 
 @tool
@@ -80,11 +210,7 @@ def list_running_servers() -> Dict[str, Any]:
 def get_server_metrics(hostname: str) -> Dict[str, Any]:
     """Get detailed metrics (current/average/peak) for the given hostname."""
     host = _extract_hostname(hostname)
-    r = _safe_get(f"{MONITORING_API_URL}/servers/{host}/metrics")
-    if r.status_code == 404:
-        return {"error": f"Server '{host}' not found."}
-    r.raise_for_status()
-    return r.json()
+    return _get_server_json_cached(host, "metrics")
 
 
 TOOLS = [get_server_status, get_server_logs, list_running_servers, get_server_metrics]
@@ -102,17 +228,83 @@ STRICT RULES:
 - If a field is not present in TOOL_RESULT, say "Not provided by monitoring API" and do not invent it.
 - Do not invent IP addresses, timestamps, or log lines.
 - Keep the answer short and actionable.
+- TOOL_RESULT_JSON is intentionally compact (no whitespace) to save tokens.
 """
 
 
+@lru_cache(maxsize=1)
+def _get_llm():
+    """Chat model for grounded final answers, built once and reused."""
+    return ChatOllama(model=OLLAMA_FINAL_ANSWER_MODEL, temperature=0)
+
+
+@lru_cache(maxsize=1)
+def _get_llm_with_tools():
+    """Chat model with TOOLS bound, built once and reused."""
+    return ChatOllama(model=OLLAMA_MODEL, temperature=0).bind_tools(TOOLS)
+
+
+# Questions whose whole answer is one tool's output; anything else (e.g.
+# "status ... and show me its recent logs") stays in the tool-calling loop
+_SINGLE_TOOL_INTENTS = {
+    "get_server_status": re.compile(
+        r"^\s*(is\s+(server\s+)?\S+\s+healthy|what\s+is\s+the\s+status\s+of\s+(server\s+)?\S+?)\s*[?.]?\s*$", re.I),
+    "list_running_servers": re.compile(
+        r"^\s*list\s+(all\s+)?running\s+servers\s*[?.]?\s*$", re.I),
+    "get_server_metrics": re.compile(
+        r"^\s*(give|show)\s+(me\s+)?(detailed\s+)?metrics\s+for\s+(server\s+)?\S+?\s*[?.]?\s*$", re.I),
+    "get_server_logs": re.compile(
+        r"^\s*(show|get)\s+(me\s+)?(the\s+)?(recent\s+)?logs\s+(for|from|of)\s+(server\s+)?\S+?\s*[?.]?\s*$", re.I),
+}
+
+
+def _try_template_answer(tool_name: str, tool_out: Any) -> Optional[str]:
+    """
+    Deterministic one-line answer for tool outputs with a known shape.
+    Returns None when the output needs the LLM to interpret it (e.g. logs).
+    """
+    # Errors (e.g. a 404 on a misspelled hostname) go back to the LLM to retry
+    if not isinstance(tool_out, dict) or "error" in tool_out:
+        return None
+
+    try:
+        if tool_name == "get_server_status":
+            return (
+                f"{tool_out['hostname']} is {tool_out['status']} "
+                f"(CPU {tool_out['cpu_percent']}%, memory {tool_out['memory_percent']}%, "
+                f"disk {tool_out['disk_percent']}%)."
+            )
+        if tool_name == "list_running_servers":
+            names = ", ".join(s["hostname"] for s in tool_out["servers"])
+            return f"{tool_out['total']} running server(s): {names or 'none'}."
+        if tool_name == "get_server_metrics":
+            cur, avg, peak = tool_out["current"], tool_out["average"], tool_out["peak"]
+            return (
+                f"{tool_out['hostname']} metrics ({tool_out['period']}): "
+                f"CPU {cur['cpu_percent']}% now / {avg['cpu_percent']}% avg / {peak['cpu_percent']:.1f}% peak; "
+                f"memory {cur['memory_percent']}% now / {avg['memory_percent']}% avg / {peak['memory_percent']:.1f}% peak; "
+                f"disk {cur['disk_percent']}%."
+            )
+    except (KeyError, TypeError, ValueError):
+        return None
+    return None
+
+
 def _final_answer(question: str, tool_name: str, tool_args: dict, tool_out: Any) -> str:
-    """Generate a grounded final answer strictly from tool output JSON."""
-    llm = ChatOllama(model=OLLAMA_MODEL, temperature=0)
+    """
+    Generate a grounded final answer strictly from tool output JSON.
+    Known output shapes are answered from a template without an LLM pass.
+    """
+    templated = _try_template_answer(tool_name, tool_out)
+    if templated is not None:
+        return templated
+
+    llm = _get_llm()
 
     payload = {
         "tool": tool_name,
         "args": tool_args,
-        "result": tool_out,
+        "result": _trim_logs(tool_out),
     }
 
     prompt = (
@@ -120,7 +312,7 @@ def _final_answer(question: str, tool_name: str, tool_args: dict, tool_out: Any)
         + "\nUSER_QUESTION:\n"
         + question
         + "\n\nTOOL_RESULT_JSON:\n"
-        + json.dumps(payload, indent=2)
+        + _compact_json(payload)
         + "\n\nWrite the final answer now:"
     )
     return llm.invoke(prompt).content.strip()
@@ -130,15 +322,35 @@ def _final_answer(question: str, tool_name: str, tool_args: dict, tool_out: Any)
 # Tool-calling loop (max 2)
 # -------------------------
 
+def _run_one_tool(call: dict) -> Tuple[Any, Any]:
+    """Execute one tool call, returning (tool_call_id, tool output)."""
+    tool_name = call["name"]
+    tool_args = call.get("args", {}) or {}
+
+    if tool_name not in TOOL_MAP:
+        tool_out = {"error": f"Unknown tool: {tool_name}"}
+    else:
+        try:
+            tool_out = TOOL_MAP[tool_name].invoke(tool_args)
+        except Exception as e:
+            tool_out = {"error": str(e)}
+
+    return call.get("id"), tool_out
+
+
 def ask_monitoring_agent(question: str, max_tool_calls: int = 2) -> str:
     """
     Uses tool calling (structured tool_calls) with Ollama.
     Key behavior:
-    - If a tool is called once, we STOP and produce a grounded final answer from that tool output.
+    - If the question maps to a single tool (see _SINGLE_TOOL_INTENTS), we STOP and
+      produce a grounded final answer from that tool output (template when the
+      shape is known, else OLLAMA_FINAL_ANSWER_MODEL).
     - No ReAct parsing, no infinite loops.
     """
-    llm = ChatOllama(model=OLLAMA_MODEL, temperature=0).bind_tools(TOOLS)
-    messages = [HumanMessage(content=question)]
+    llm = _get_llm_with_tools()
+    question_msg = HumanMessage(content=question)
+    messages = [question_msg]
+    earlier_results = []
 
     for iteration in range(max_tool_calls):
         ai = llm.invoke(messages)
@@ -147,28 +359,38 @@ def ask_monitoring_agent(question: str, max_tool_calls: int = 2) -> str:
         if not getattr(ai, "tool_calls", None):
             return ai.content.strip()
 
-        # Execute all requested tools
-        for call in ai.tool_calls:
-            tool_name = call["name"]
-            tool_args = call.get("args", {}) or {}
-            tool_call_id = call.get("id")
-
-            if tool_name not in TOOL_MAP:
-                tool_out = {"error": f"Unknown tool: {tool_name}"}
-            else:
-                try:
-                    tool_out = TOOL_MAP[tool_name].invoke(tool_args)
-                except Exception as e:
-                    tool_out = {"error": str(e)}
-
-            # Send tool result back to LLM
-            messages.append(ToolMessage(
-                content=json.dumps(tool_out),
-                tool_call_id=tool_call_id
+        # Execute all requested tools concurrently (independent HTTP GETs)
+        with ThreadPoolExecutor(max_workers=min(len(ai.tool_calls), 8)) as ex:
+            results = list(ex.map(_run_one_tool, ai.tool_calls))
+
+        # A single first-turn call that fully answers the question gets a
+        # grounded final answer (template or OLLAMA_FINAL_ANSWER_MODEL);
+        # errors stay in the loop so the model can retry
+        if iteration == 0 and len(results) == 1:
+            call, (_, tool_out) = ai.tool_calls[0], results[0]
+            intent = _SINGLE_TOOL_INTENTS.get(call["name"])
+            if (intent is not None and intent.match(question)
+                    and not (isinstance(tool_out, dict) and "error" in tool_out)):
+                return _final_answer(question, call["name"], call.get("args") or {}, tool_out)
+
+        fitted = [_fit_tool_result(tool_out) for _, tool_out in results]
+
+        # Keep the prompt bounded: only the latest AI turn and its tool
+        # messages are resent; earlier turns collapse into one summary message
+        # that still carries their (size-capped) results
+        messages = []
+        if earlier_results:
+            messages.append(SystemMessage(
+                content="Results of tools already called:\n" + "\n".join(earlier_results)
             ))
-
-        # Add AI message to maintain conversation structure
-        messages.insert(-len(ai.tool_calls), ai)
+        messages.append(question_msg)
+        messages.append(ai)
+        for (tool_call_id, _), content in zip(results, fitted):
+            messages.append(ToolMessage(content=content, tool_call_id=tool_call_id))
+        earlier_results.extend(
+            f"{call['name']}({_compact_json(call.get('args') or {})}) -> {content}"
+            for call, content in zip(ai.tool_calls, fitted)
+        )
 
         # Continue the loop - LLM can call more tools or give final answer
 
@@ -183,7 +405,7 @@ def ask_monitoring_agent(question: str, max_tool_calls: int = 2) -> str:
 
 if __name__ == "__main__":
     # Ensure Monitoring API is up
-    requests.get(f"{MONITORING_API_URL}/", timeout=5).raise_for_status()
+    _SESSION.get(f"{MONITORING_API_URL}/", timeout=5).raise_for_status()
     print("✅ Monitoring API is reachable.\n")
 
     tests = [
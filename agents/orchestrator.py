@@ -6,31 +6,510 @@ Coordinates monitoring, alerting, and healing actions with AI-powered diagnostic
 # Add project root to Python path
 import sys
 from pathlib import Path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
 
+import io
+import re
+import json
 import time
+import asyncio
 import argparse
+import threading
 from datetime import datetime
-from typing import Dict, Any
+from functools import partial
+from typing import Dict, Any, List, Optional, Tuple
 
-from agents.alert_manager_agent import send_container_down_alert
+# Alerts are queued for a background SMTP worker; sending never blocks a cycle
+from agents.alert_manager_agent import send_container_down_alert, flush_alerts
 from agents.incident_response_agent import (
+    ContainerState,
     get_health_status,
     heal_container,
-    heal_all_containers
+    heal_containers,
+    warmup
 )
 # Import LLM-based monitoring for intelligent diagnosis
-from agents.docker_monitoring_agent import monitor_containers
+from agents.docker_monitoring_agent import monitor_containers, monitor_containers_stream
 
-from config.config import MONITORING_INTERVAL_SECONDS
+from config.config import get_config
+
+# Upper bound on stopped containers handled concurrently
+MAX_INCIDENT_WORKERS = 8
+
+# Whether the LLM diagnosis steps run (set from --ai/--no-ai in main())
+USE_AI = True
+
+# Minutes between AI summaries of an all-healthy fleet (0 = never; set in main())
+HEALTHY_SUMMARY_INTERVAL_MIN = 0
+
+_last_summary_t: Optional[float] = None
+
+
+# -------------------------
+# Console Output
+# -------------------------
+
+BAR80 = "=" * 80
+DASH80 = "-" * 80
+DASH60 = "-" * 60
+
+# Incident header and AI section header, each rendered as one string
+_INCIDENT_TMPL = (
+    "\n{bar}\n"
+    "🚨 INCIDENT DETECTED: {name}\n"
+    "   Role: {role}\n"
+    "   Status: {status}\n"
+    "   Mode: {mode}\n"
+    "{bar}\n"
+)
+_SECTION_TMPL = "\n{title}\n{bar}\n"
+
+_BANNER = "\n".join([
+    "",
+    "╔" + "═" * 78 + "╗",
+    "║" + " " * 78 + "║",
+    "║" + "  🤖 AI-POWERED IT OPERATIONS ORCHESTRATOR  ".center(78) + "║",
+    "║" + " " * 78 + "║",
+    "╚" + "═" * 78 + "╝",
+    "",
+])
+
+
+def _print_header(title: str, blank_before: bool = False) -> None:
+    """Print a title between two bars with a single write."""
+    prefix = "\n" if blank_before else ""
+    sys.stdout.write(f"{prefix}{BAR80}\n{title}\n{BAR80}\n")
+
+
+# -------------------------
+# Health Snapshot Cache
+# -------------------------
+
+# Seconds a health snapshot is reused (nested AI prompts in one cycle share it)
+HEALTH_CACHE_TTL_SECONDS = 2.0
+
+_HEALTH_CACHE = {"t": 0.0, "v": None}
+
+
+def _cached_health(ttl: float = HEALTH_CACHE_TTL_SECONDS) -> Dict[str, Any]:
+    """get_health_status() memoized for `ttl` seconds on the monotonic clock."""
+    now = time.monotonic()
+    if _HEALTH_CACHE["v"] is not None and now - _HEALTH_CACHE["t"] < ttl:
+        return _HEALTH_CACHE["v"]
+    health = get_health_status()
+    _HEALTH_CACHE.update(t=now, v=health)
+    return health
+
+
+# -------------------------
+# AI Diagnosis Helpers
+# -------------------------
+
+# Fixed instructions for every incident diagnosis. Kept byte-identical and in
+# front of the short per-container suffix so the LLM server can reuse the
+# cached prompt prefix across containers and modes.
+DIAG_SYS_PROMPT = (
+    "You are an SRE diagnostic assistant. Given a container name and its current Docker state, "
+    "read its last 20 log lines and output JSON with fields: "
+    "status (summary of the state, with the exit code if relevant), "
+    "logs_summary (errors, warnings or crash messages in the logs), "
+    "root_cause (most likely cause: configuration issues, resource constraints, "
+    "dependency failures, or application errors), "
+    "restart_safe (whether restarting is safe, or what must be fixed first).\n"
+)
+
+# One diagnosis per container; each mode prints the sections it needs
+_CHECK_DIAGNOSIS_SECTIONS = (
+    ("status", "📋 Container details:"),
+    ("logs_summary", "📜 Recent logs:"),
+    ("root_cause", "🔎 Root cause:"),
+)
+_HEAL_DIAGNOSIS_SECTIONS = (
+    ("root_cause", "📋 Failure reason:"),
+    ("restart_safe", "🔍 Restart safety:"),
+)
+
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.S)
+
+
+def _parse_json_answer(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse a JSON object out of an LLM answer.
+    Falls back to the outermost {...} block when the model wraps it in prose.
+    
+    Returns:
+        Parsed dict, or None if the answer holds no JSON object
+    """
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        match = _JSON_OBJECT_RE.search(text)
+        if match is None:
+            return None
+        try:
+            parsed = json.loads(match.group(0))
+        except ValueError:
+            return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _diagnosis_question(container: ContainerState) -> str:
+    """Stable DIAG_SYS_PROMPT prefix + the variable container state."""
+    return (
+        f"{DIAG_SYS_PROMPT}container={container.name} current_status={container.status} "
+        f"role={container.role} image={container.image}"
+    )
+
+
+def _print_diagnosis(answer: str, sections, emit=print) -> None:
+    """Print each requested section of a fused diagnosis (raw text if it isn't JSON)."""
+    parsed = _parse_json_answer(answer)
+    if parsed is None:
+        emit(answer)
+        return
+    for key, title in sections:
+        emit(f"\n{title}")
+        emit(parsed.get(key, "(not provided)"))
+
+
+async def _print_stream(question: str) -> str:
+    """
+    Write the agent's answer to stdout as it is generated.
+    The blocking generator is advanced one chunk at a time off the event loop.
+    
+    Returns:
+        The full answer text
+    """
+    chunks = monitor_containers_stream(question)
+    parts = []
+    while (chunk := await asyncio.to_thread(next, chunks, None)) is not None:
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+        parts.append(chunk)
+    sys.stdout.write("\n")
+    return "".join(parts)
+
+
+def _healthy_summary_due() -> bool:
+    """Rate-limit the all-healthy AI summary to HEALTHY_SUMMARY_INTERVAL_MIN."""
+    global _last_summary_t
+    if not USE_AI or HEALTHY_SUMMARY_INTERVAL_MIN <= 0:
+        return False
+    now = time.monotonic()
+    if _last_summary_t is not None and now - _last_summary_t < HEALTHY_SUMMARY_INTERVAL_MIN * 60:
+        return False
+    _last_summary_t = now
+    return True
+
+
+async def _print_healthy_summary(separator: str) -> None:
+    """Stream an AI health summary for a fleet with nothing down."""
+    sys.stdout.write(_SECTION_TMPL.format(title="🤖 AI Health Summary:", bar=separator))
+    try:
+        await _print_stream(
+            "All containers are running. Provide a brief health summary and any recommendations."
+        )
+    except Exception as e:
+        print(f"⚠️  Summary generation failed: {e}")
+    print(separator)
+
+
+# -------------------------
+# Per-Incident Handling
+# -------------------------
+
+async def _check_incident(container: ContainerState, emit) -> None:
+    """CHECK mode for one stopped container: AI diagnosis + alert, no healing."""
+    container_name, status, role = container.name, container.status, container.role
+    
+    emit(_INCIDENT_TMPL.format(bar=BAR80, name=container_name, role=role, status=status,
+                               mode="CHECK ONLY (no auto-healing)"), end="")
+    
+    if USE_AI:
+        # ================================
+        # AI DIAGNOSIS - Status, Logs and Root Cause (one LLM call)
+        # ================================
+        emit(_SECTION_TMPL.format(title="🤖 AI Analysis: status, logs and root cause...", bar=DASH80), end="")
+        try:
+            diagnosis = await asyncio.to_thread(monitor_containers, _diagnosis_question(container))
+            _print_diagnosis(diagnosis, _CHECK_DIAGNOSIS_SECTIONS, emit)
+        except Exception as e:
+            emit(f"⚠️  AI analysis failed: {e}")
+        emit(DASH80)
+    
+    # Send alert with diagnosis summary
+    emit(f"\n📧 Sending alert to operations team...")
+    alert_result = send_container_down_alert(
+        container_name=container_name,
+        auto_heal_result={
+            "success": False,
+            "error": "Check mode - no healing attempted (awaiting manual intervention)",
+            "old_status": status,
+            "attempts": 0
+        }
+    )
+    
+    if alert_result.get('success'):
+        emit(f"   ✅ Alert queued for delivery")
+    else:
+        emit(f"   ⚠️  Alert logged to file")
+    
+    emit(f"\n{BAR80}\n")
+
+
+async def _heal_diagnosis(container: ContainerState, emit) -> None:
+    """HEAL mode, before the restart: incident header + pre-healing AI diagnosis."""
+    container_name, status, role = container.name, container.status, container.role
+    
+    emit(_INCIDENT_TMPL.format(bar=BAR80, name=container_name, role=role, status=status,
+                               mode="HEAL (AI diagnosis + auto-restart)"), end="")
+    
+    if USE_AI:
+        # ================================
+        # AI DIAGNOSIS - Before Healing
+        # ================================
+        emit(_SECTION_TMPL.format(title="🤖 Pre-Healing AI Diagnosis:", bar=DASH80), end="")
+        
+        # Failure reason and restart safety in one LLM call
+        try:
+            pre_heal = await asyncio.to_thread(monitor_containers, _diagnosis_question(container))
+            _print_diagnosis(pre_heal, _HEAL_DIAGNOSIS_SECTIONS, emit)
+        except Exception as e:
+            emit(f"⚠️  Analysis failed: {e}")
+        
+        emit(DASH80)
+    
+    # ================================
+    # HEALING ACTION
+    # ================================
+    emit(f"\n🔧 Attempting auto-heal...")
+
+
+async def _heal_followup(container: ContainerState, emit, heal_result: Dict[str, Any]) -> None:
+    """HEAL mode, after the restart: report, AI verification or failure analysis, alert."""
+    container_name = container.name
+    success = heal_result.get('success')
+    attempts = heal_result.get('attempts', 1 if success else 0)
+    
+    if success:
+        emit(f"   ✅ Auto-heal successful! Container restarted.")
+        emit(f"   📊 Restart attempts: {attempts}")
+        emit(f"   📊 Old status: {heal_result.get('old_status')}")
+        emit(f"   📊 New status: {heal_result.get('new_status')}")
+        
+        if USE_AI:
+            # ================================
+            # AI DIAGNOSIS - Post-Healing Verification
+            # ================================
+            emit(_SECTION_TMPL.format(title="🤖 Post-Healing AI Verification:", bar=DASH80), end="")
+            
+            # Wait a moment for container to stabilize
+            emit("⏳ Waiting 3 seconds for container to stabilize...")
+            await asyncio.sleep(3)
+            
+            try:
+                verification = await asyncio.to_thread(
+                    monitor_containers,
+                    f"Container {container_name} was just restarted. Check its current status and recent logs "
+                    f"to verify it's running properly without errors."
+                )
+                emit(verification)
+            except Exception as e:
+                emit(f"⚠️  Verification failed: {e}")
+            
+            emit(DASH80)
+    
+    else:
+        emit(f"   ❌ Auto-heal FAILED: {heal_result.get('error')}")
+        emit(f"   📊 Attempts made: {attempts}")
+        
+        if USE_AI:
+            # ================================
+            # AI DIAGNOSIS - Why Healing Failed
+            # ================================
+            emit(_SECTION_TMPL.format(title="🤖 AI Analysis - Why Healing Failed:", bar=DASH80), end="")
+            try:
+                failure_reason = await asyncio.to_thread(
+                    monitor_containers,
+                    f"Container {container_name} failed to restart after {attempts} attempts. "
+                    f"Check logs and status to determine why the restart failed. What manual intervention is needed?"
+                )
+                emit(failure_reason)
+            except Exception as e:
+                emit(f"⚠️  Failure analysis unavailable: {e}")
+            emit(DASH80)
+    
+    # Send alert with full diagnosis
+    emit(f"\n📧 Sending detailed alert...")
+    alert_result = send_container_down_alert(
+        container_name=container_name,
+        auto_heal_result=heal_result
+    )
+    
+    if alert_result.get('success'):
+        emit(f"   ✅ Alert queued for delivery")
+    else:
+        emit(f"   ⚠️  Alert logged to file")
+    
+    emit(f"\n{BAR80}\n")
+
+
+async def _heal_incident(container: ContainerState, emit) -> None:
+    """HEAL mode for one stopped container: AI diagnosis + auto-heal + alert."""
+    await _heal_diagnosis(container, emit)
+    heal_result = await asyncio.to_thread(heal_container, container.name)
+    await _heal_followup(container, emit, heal_result)
+
+
+async def _run_buffered(handler, container: ContainerState, limit: asyncio.Semaphore, *args) -> str:
+    """
+    Run one per-container handler, buffering its console output.
+    
+    Args:
+        handler: Coroutine function called as handler(container, emit, *args)
+        container: Entry from health['stopped_containers']
+        limit: Caps how many containers are handled at once
+    
+    Returns:
+        Everything the handler printed, to be written in one piece
+    """
+    out = io.StringIO()
+    emit = partial(print, file=out)
+    try:
+        async with limit:
+            await handler(container, emit, *args)
+    except Exception as e:
+        emit(f"⚠️  Incident handling failed for {container.name}: {e}")
+    return out.getvalue()
+
+
+async def _handle_stopped_containers(stopped: List[ContainerState], mode: str) -> None:
+    """
+    Run the per-container handlers concurrently (LLM, Docker and SMTP calls
+    are all I/O bound), then print each container's output in original order
+    so incidents don't interleave.
+    """
+    limit = asyncio.Semaphore(MAX_INCIDENT_WORKERS)
+    
+    if mode == "heal" and len(stopped) > 1:
+        # Diagnose everything, restart all in one batch call, then follow up
+        before = await asyncio.gather(*(_run_buffered(_heal_diagnosis, c, limit) for c in stopped))
+        heal_results = await asyncio.to_thread(heal_containers, [c.name for c in stopped])
+        after = await asyncio.gather(*(
+            _run_buffered(_heal_followup, c, limit, heal_results[c.name]) for c in stopped
+        ))
+        outputs = [b + a for b, a in zip(before, after)]
+    else:
+        handler = _heal_incident if mode == "heal" else _check_incident
+        outputs = await asyncio.gather(*(_run_buffered(handler, c, limit) for c in stopped))
+    
+    sys.stdout.write("".join(outputs))
+    sys.stdout.flush()
+
+
+# -------------------------
+# Continuous-Mode Handlers
+# -------------------------
+
+async def _handle_incident_check(container: ContainerState, heal_result: Optional[Dict[str, Any]] = None,
+                                 suppressed: bool = False) -> None:
+    """Continuous CHECK mode: alert only, no healing (suppressed incidents never get here)."""
+    print(f"\n⚠️  CHECK MODE: Not healing {container.name}, only alerting")
+    
+    send_container_down_alert(
+        container_name=container.name,
+        auto_heal_result={
+            "success": False,
+            "error": "Check mode - no healing attempted",
+            "old_status": container.status,
+            "attempts": 0
+        }
+    )
+    print(f"   ✅ Alert queued")
+
+
+async def _handle_incident_heal(container: ContainerState, heal_result: Optional[Dict[str, Any]] = None,
+                                suppressed: bool = False) -> Dict[str, Any]:
+    """
+    Continuous HEAL mode: auto-heal, quick AI verification, alert.
+    heal_result is passed in when the restart already ran as part of a batch.
+    A suppressed (unchanged, recently alerted) incident is still healed, but
+    no duplicate alert is sent.
+    
+    Returns:
+        The heal result
+    """
+    container_name = container.name
+    print(f"\n🔧 HEAL MODE: Auto-heal of {container_name}...")
+    
+    if heal_result is None:
+        heal_result = await asyncio.to_thread(heal_container, container_name)
+    
+    if heal_result.get('success'):
+        print(f"   ✅ Auto-heal successful!")
+        
+        # Quick verification
+        if USE_AI:
+            await asyncio.sleep(2)
+            try:
+                print(f"\n🤖 Verification: ", end="")
+                await _print_stream(
+                    f"Verify {container_name} is now running properly"
+                )
+            except Exception:
+                pass
+    else:
+        print(f"   ❌ Auto-heal failed: {heal_result.get('error')}")
+    
+    # Send alert
+    if not suppressed:
+        send_container_down_alert(container_name, heal_result)
+    
+    return heal_result
+
+
+# Last real diagnosis per container: name -> (status, monotonic time)
+_SEEN: Dict[str, Tuple[str, float]] = {}
+
+
+def _recently_diagnosed(container: ContainerState, cooldown: float) -> Optional[float]:
+    """
+    Check whether an unchanged incident was already handled within `cooldown`.
+    
+    Returns:
+        Seconds since that diagnosis if it should be suppressed, else None
+        (and the container is recorded as diagnosed now)
+    """
+    now = time.monotonic()
+    seen = _SEEN.get(container.name)
+    if seen is not None and seen[0] == container.status and now - seen[1] < cooldown:
+        return now - seen[1]
+    _SEEN[container.name] = (container.status, now)
+    return None
+
+
+def _forget_recovered(stopped: List[ContainerState]) -> None:
+    """Drop cooldown entries for containers that are no longer down."""
+    for name in _SEEN.keys() - {c.name for c in stopped}:
+        del _SEEN[name]
+
+
+# Resolved once per continuous session instead of comparing mode strings per container
+_HANDLERS = {"check": _handle_incident_check, "heal": _handle_incident_heal}
+
+_MODE_LABELS = {
+    "check": "CHECK MODE (AI diagnosis, no healing)",
+    "heal": "HEAL MODE (AI diagnosis + auto-healing)",
+}
 
 
 # -------------------------
 # Orchestration Logic
 # -------------------------
 
-def orchestrate_check_only() -> Dict[str, Any]:
+async def orchestrate_check_only() -> Dict[str, Any]:
     """
     ONE-TIME health check with AI-powered diagnosis.
     No healing - only monitoring, AI analysis, and alerting.
@@ -38,18 +517,14 @@ def orchestrate_check_only() -> Dict[str, Any]:
     Returns:
         Dict with health status and any alerts sent
     """
-    print("=" * 80)
-    print("🔍 ONE-TIME HEALTH CHECK (AI-Powered Diagnosis)")
-    print("=" * 80)
+    _print_header("🔍 ONE-TIME HEALTH CHECK (AI-Powered Diagnosis)")
     print()
     
     # Get current health status
-    health = get_health_status()
+    health = await asyncio.to_thread(_cached_health)
     
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print("=" * 80)
-    print(f"🔍 Monitoring Cycle #1 - {timestamp}")
-    print("=" * 80)
+    _print_header(f"🔍 Monitoring Cycle #1 - {timestamp}")
     
     running_count = health['running']
     total_count = health['total']
@@ -61,103 +536,20 @@ def orchestrate_check_only() -> Dict[str, Any]:
         print(f"⚠️  Found {stopped_count} unhealthy container(s)")
         
         # ALERT ONLY - NO HEALING IN CHECK MODE
-        for container in health['stopped_containers']:
-            container_name = container['name']
-            status = container['status']
-            role = container.get('role', 'unknown')
-            
-            print(f"\n{'=' * 80}")
-            print(f"🚨 INCIDENT DETECTED: {container_name}")
-            print(f"   Role: {role}")
-            print(f"   Status: {status}")
-            print(f"   Mode: CHECK ONLY (no auto-healing)")
-            print("=" * 80)
-            
-            # ================================
-            # AI DIAGNOSIS - Step 1: Check Status
-            # ================================
-            print(f"\n🤖 AI Analysis Step 1: Checking container details...")
-            print("-" * 80)
-            try:
-                status_analysis = monitor_containers(
-                    f"Get detailed status of {container_name} including when it stopped and exit code"
-                )
-                print(status_analysis)
-            except Exception as e:
-                print(f"⚠️  AI analysis failed: {e}")
-            print("-" * 80)
-            
-            # ================================
-            # AI DIAGNOSIS - Step 2: Check Logs
-            # ================================
-            print(f"\n🤖 AI Analysis Step 2: Analyzing recent logs...")
-            print("-" * 80)
-            try:
-                log_analysis = monitor_containers(
-                    f"Show me the last 15 lines of logs from {container_name} and identify any errors or warnings"
-                )
-                print(log_analysis)
-            except Exception as e:
-                print(f"⚠️  Log analysis failed: {e}")
-            print("-" * 80)
-            
-            # ================================
-            # AI DIAGNOSIS - Step 3: Root Cause Analysis
-            # ================================
-            print(f"\n🤖 AI Analysis Step 3: Root cause diagnosis...")
-            print("-" * 80)
-            try:
-                root_cause = monitor_containers(
-                    f"Based on the status and logs of {container_name}, what are the most likely causes for this failure? "
-                    f"Consider: configuration issues, resource constraints, dependency failures, or application errors."
-                )
-                print(root_cause)
-            except Exception as e:
-                print(f"⚠️  Root cause analysis failed: {e}")
-            print("-" * 80)
-            
-            # Send alert with diagnosis summary
-            print(f"\n📧 Sending alert to operations team...")
-            alert_result = send_container_down_alert(
-                container_name=container_name,
-                auto_heal_result={
-                    "success": False,
-                    "error": "Check mode - no healing attempted (awaiting manual intervention)",
-                    "old_status": status,
-                    "attempts": 0
-                }
-            )
-            
-            if alert_result.get('success'):
-                print(f"   ✅ Alert sent successfully")
-            else:
-                print(f"   ⚠️  Alert logged to file")
-            
-            print(f"\n{'=' * 80}\n")
+        await _handle_stopped_containers(health['stopped_containers'], "check")
     else:
         print("\n✅ All containers healthy")
         
         # Optional: Get AI health summary even when all is well
-        print(f"\n🤖 AI Health Summary:")
-        print("-" * 80)
-        try:
-            summary = monitor_containers(
-                "All containers are running. Provide a brief health summary and any recommendations."
-            )
-            print(summary)
-        except Exception as e:
-            print(f"⚠️  Summary generation failed: {e}")
-        print("-" * 80)
+        if _healthy_summary_due():
+            await _print_healthy_summary(DASH80)
     
-    print()
-    print("=" * 80)
-    print("✅ Check Complete")
-    print("=" * 80)
+    _print_header("✅ Check Complete", blank_before=True)
     
     return health
 
 
-def orchestrate_heal_once() -> Dict[str, Any]:
+async def orchestrate_heal_once() -> Dict[str, Any]:
     """
     ONE-TIME healing cycle with AI-powered diagnosis.
     Monitor + AI diagnosis + auto-heal + alert.
@@ -165,18 +557,14 @@ def orchestrate_heal_once() -> Dict[str, Any]:
     Returns:
         Dict with health status and healing results
     """
-    print("=" * 80)
-    print("🔧 ONE-TIME AUTO-HEAL (AI-Powered Diagnosis)")
-    print("=" * 80)
+    _print_header("🔧 ONE-TIME AUTO-HEAL (AI-Powered Diagnosis)")
     print()
     
     # Get current health status
-    health = get_health_status()
+    health = await asyncio.to_thread(_cached_health)
     
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print("=" * 80)
-    print(f"🔍 Monitoring Cycle #1 - {timestamp}")
-    print("=" * 80)
+    _print_header(f"🔍 Monitoring Cycle #1 - {timestamp}")
     
     running_count = health['running']
     total_count = health['total']
@@ -188,125 +576,16 @@ def orchestrate_heal_once() -> Dict[str, Any]:
         print(f"⚠️  Found {stopped_count} unhealthy container(s)")
         
         # HEAL MODE - AI DIAGNOSIS + AUTO-HEALING
-        for container in health['stopped_containers']:
-            container_name = container['name']
-            status = container['status']
-            role = container.get('role', 'unknown')
-            
-            print(f"\n{'=' * 80}")
-            print(f"🚨 INCIDENT DETECTED: {container_name}")
-            print(f"   Role: {role}")
-            print(f"   Status: {status}")
-            print(f"   Mode: HEAL (AI diagnosis + auto-restart)")
-            print("=" * 80)
-            
-            # ================================
-            # AI DIAGNOSIS - Before Healing
-            # ================================
-            print(f"\n🤖 Pre-Healing AI Diagnosis:")
-            print("-" * 80)
-            
-            # Step 1: Check what went wrong
-            print("\n📋 Analyzing failure reason...")
-            try:
-                failure_analysis = monitor_containers(
-                    f"Container {container_name} is {status}. Check its logs for the last 20 lines "
-                    f"and tell me what caused it to fail. Look for error messages, exit codes, or crash logs."
-                )
-                print(failure_analysis)
-            except Exception as e:
-                print(f"⚠️  Analysis failed: {e}")
-            
-            # Step 2: Check if restart is safe
-            print(f"\n🔍 Checking if restart is safe...")
-            try:
-                restart_safety = monitor_containers(
-                    f"Based on the failure of {container_name}, is it safe to restart? "
-                    f"Are there any configuration issues or dependencies that need fixing first?"
-                )
-                print(restart_safety)
-            except Exception as e:
-                print(f"⚠️  Safety check failed: {e}")
-            
-            print("-" * 80)
-            
-            # ================================
-            # HEALING ACTION
-            # ================================
-            print(f"\n🔧 Attempting auto-heal...")
-            heal_result = heal_container(container_name)
-            
-            if heal_result.get('success'):
-                print(f"   ✅ Auto-heal successful! Container restarted.")
-                print(f"   📊 Restart attempts: {heal_result.get('attempts', 1)}")
-                print(f"   📊 Old status: {heal_result.get('old_status')}")
-                print(f"   📊 New status: {heal_result.get('new_status')}")
-                
-                # ================================
-                # AI DIAGNOSIS - Post-Healing Verification
-                # ================================
-                print(f"\n🤖 Post-Healing AI Verification:")
-                print("-" * 80)
-                
-                # Wait a moment for container to stabilize
-                print("⏳ Waiting 3 seconds for container to stabilize...")
-                time.sleep(3)
-                
-                try:
-                    verification = monitor_containers(
-                        f"Container {container_name} was just restarted. Check its current status and recent logs "
-                        f"to verify it's running properly without errors."
-                    )
-                    print(verification)
-                except Exception as e:
-                    print(f"⚠️  Verification failed: {e}")
-                
-                print("-" * 80)
-                
-            else:
-                print(f"   ❌ Auto-heal FAILED: {heal_result.get('error')}")
-                print(f"   📊 Attempts made: {heal_result.get('attempts', 0)}")
-                
-                # ================================
-                # AI DIAGNOSIS - Why Healing Failed
-                # ================================
-                print(f"\n🤖 AI Analysis - Why Healing Failed:")
-                print("-" * 80)
-                try:
-                    failure_reason = monitor_containers(
-                        f"Container {container_name} failed to restart after {heal_result.get('attempts', 0)} attempts. "
-                        f"Check logs and status to determine why the restart failed. What manual intervention is needed?"
-                    )
-                    print(failure_reason)
-                except Exception as e:
-                    print(f"⚠️  Failure analysis unavailable: {e}")
-                print("-" * 80)
-            
-            # Send alert with full diagnosis
-            print(f"\n📧 Sending detailed alert...")
-            alert_result = send_container_down_alert(
-                container_name=container_name,
-                auto_heal_result=heal_result
-            )
-            
-            if alert_result.get('success'):
-                print(f"   ✅ Alert sent successfully")
-            else:
-                print(f"   ⚠️  Alert logged to file")
-            
-            print(f"\n{'=' * 80}\n")
+        await _handle_stopped_containers(health['stopped_containers'], "heal")
     else:
         print("\n✅ All containers healthy")
     
-    print()
-    print("=" * 80)
-    print("✅ Heal Complete")
-    print("=" * 80)
+    _print_header("✅ Heal Complete", blank_before=True)
     
     return health
 
 
-def orchestrate_continuous(mode: str = "check"):
+async def orchestrate_continuous(mode: str = "check"):
     """
     CONTINUOUS monitoring loop with AI-powered diagnostics.
     Runs until interrupted (Ctrl+C).
@@ -314,28 +593,33 @@ def orchestrate_continuous(mode: str = "check"):
     Args:
         mode: "check" (monitor + AI diagnosis only) or "heal" (monitor + AI diagnosis + heal)
     """
-    mode_label = "CHECK MODE (AI diagnosis, no healing)" if mode == "check" else "HEAL MODE (AI diagnosis + auto-healing)"
+    config = get_config()
+    interval = config.monitoring_interval_seconds
+    cooldown = config.diagnosis_cooldown_seconds
+    handler = _HANDLERS[mode]
+    batch_heal = mode == "heal"
+    mode_label = _MODE_LABELS[mode]
     
-    print("=" * 80)
-    print(f"🔄 CONTINUOUS MONITORING - {mode_label}")
-    print(f"⏱️  Interval: {MONITORING_INTERVAL_SECONDS} seconds")
-    print("   Press Ctrl+C to stop")
-    print("=" * 80)
-    print()
+    sys.stdout.write(
+        f"{BAR80}\n"
+        f"🔄 CONTINUOUS MONITORING - {mode_label}\n"
+        f"⏱️  Interval: {interval} seconds\n"
+        f"   Press Ctrl+C to stop\n"
+        f"{BAR80}\n\n"
+    )
     
     cycle_count = 0
+    next_deadline = time.monotonic()
     
     try:
         while True:
             cycle_count += 1
             
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            print("=" * 80)
-            print(f"🔍 Monitoring Cycle #{cycle_count} - {timestamp}")
-            print("=" * 80)
+            _print_header(f"🔍 Monitoring Cycle #{cycle_count} - {timestamp}")
             
             # Get current health status
-            health = get_health_status()
+            health = await asyncio.to_thread(_cached_health)
             
             running_count = health['running']
             total_count = health['total']
@@ -343,81 +627,79 @@ def orchestrate_continuous(mode: str = "check"):
             
             print(f"📊 Container Status: {running_count}/{total_count} running")
             
+            # A container that recovers and fails again gets a fresh diagnosis
+            _forget_recovered(health['stopped_containers'])
+            
             if stopped_count > 0:
                 print(f"⚠️  Found {stopped_count} unhealthy container(s)")
                 
+                pending = []
                 for container in health['stopped_containers']:
-                    container_name = container['name']
-                    status = container['status']
+                    container_name, status = container.name, container.status
                     
                     print(f"\n🚨 Incident Detected: {container_name} is {status}")
                     
-                    # ================================
-                    # AI QUICK DIAGNOSIS (Continuous mode - lighter analysis)
-                    # ================================
-                    print(f"\n🤖 AI Quick Diagnosis:")
-                    print("-" * 60)
-                    try:
-                        quick_diagnosis = monitor_containers(
-                            f"Container {container_name} is {status}. Quick diagnosis: "
-                            f"check last 10 log lines and identify the issue."
-                        )
-                        print(quick_diagnosis)
-                    except Exception as e:
-                        print(f"⚠️  Diagnosis unavailable: {e}")
-                    print("-" * 60)
+                    # Repeat diagnosis and alert are suppressed; healing is not
+                    age = _recently_diagnosed(container, cooldown)
+                    suppressed = age is not None
+                    if suppressed:
+                        print(f"⏭️  Diagnosis suppressed (diagnosed {age:.0f}s ago)")
+                        if not batch_heal:
+                            continue
+                    elif USE_AI:
+                        # ================================
+                        # AI QUICK DIAGNOSIS (Continuous mode - lighter analysis)
+                        # ================================
+                        sys.stdout.write(_SECTION_TMPL.format(title="🤖 AI Quick Diagnosis:", bar=DASH60))
+                        try:
+                            await _print_stream(
+                                f"Container {container_name} is {status}. Quick diagnosis: "
+                                f"check last 10 log lines and identify the issue."
+                            )
+                        except Exception as e:
+                            print(f"⚠️  Diagnosis unavailable: {e}")
+                        print(DASH60)
                     
-                    if mode == "heal":
-                        # HEAL MODE - Attempt healing
-                        print(f"\n🔧 HEAL MODE: Attempting auto-heal...")
-                        
-                        heal_result = heal_container(container_name)
-                        
-                        if heal_result.get('success'):
-                            print(f"   ✅ Auto-heal successful!")
-                            
-                            # Quick verification
-                            time.sleep(2)
-                            try:
-                                verify = monitor_containers(
-                                    f"Verify {container_name} is now running properly"
-                                )
-                                print(f"\n🤖 Verification: {verify}")
-                            except:
-                                pass
-                        else:
-                            print(f"   ❌ Auto-heal failed: {heal_result.get('error')}")
-                        
-                        # Send alert
-                        send_container_down_alert(container_name, heal_result)
-                    else:
-                        # CHECK MODE - Alert only
-                        print(f"\n⚠️  CHECK MODE: Not healing, only alerting")
-                        
-                        send_container_down_alert(
-                            container_name=container_name,
-                            auto_heal_result={
-                                "success": False,
-                                "error": "Check mode - no healing attempted",
-                                "old_status": status,
-                                "attempts": 0
-                            }
-                        )
-                        print(f"   ✅ Alert sent")
+                    pending.append((container, suppressed))
+                
+                # Several incidents in heal mode: restart them all in one batch
+                heal_results = {}
+                if batch_heal and len(pending) > 1:
+                    heal_results = await asyncio.to_thread(heal_containers, [c.name for c, _ in pending])
+                
+                for container, suppressed in pending:
+                    result = await handler(container, heal_results.get(container.name), suppressed)
+                    # A successful heal closes the incident; a new crash is a fresh one
+                    if result and result.get('success'):
+                        _SEEN.pop(container.name, None)
             else:
                 print("\n✅ All containers healthy")
+                
+                if _healthy_summary_due():
+                    await _print_healthy_summary(DASH60)
             
-            print(f"\n⏳ Next check in {MONITORING_INTERVAL_SECONDS} seconds...")
-            print()
-            
-            time.sleep(MONITORING_INTERVAL_SECONDS)
+            # Fixed cadence: sleep until the next deadline, not a full interval
+            # after the work; on overrun, skip ahead instead of bunching cycles
+            next_deadline += interval
+            delay = next_deadline - time.monotonic()
+            if delay > 0:
+                print(f"\n⏳ Next check in {delay:.0f} seconds...")
+                print()
+                await asyncio.sleep(delay)
+            else:
+                print(f"\n⚠️  Cycle overran the {interval}s interval by {-delay:.1f}s; starting next check now")
+                print()
+                next_deadline = time.monotonic()
     
-    except KeyboardInterrupt:
-        print()
-        print("=" * 80)
-        print("🛑 Monitoring stopped by user")
-        print(f"📊 Total cycles completed: {cycle_count}")
-        print("=" * 80)
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        sys.stdout.write(
+            f"\n{BAR80}\n"
+            f"🛑 Monitoring stopped by user\n"
+            f"📊 Total cycles completed: {cycle_count}\n"
+            f"{BAR80}\n"
+        )
+        if not flush_alerts():
+            print("⚠️  Some queued alerts were not delivered before shutdown")
 
 
 # -------------------------
@@ -440,6 +722,9 @@ Examples:
   
   # Continuous auto-healing with AI verification
   python orchestrator.py --mode heal --continuous
+  
+  # Continuous auto-healing without any LLM calls
+  python orchestrator.py --mode heal --continuous --no-ai
         """
     )
     
@@ -456,25 +741,42 @@ Examples:
         help="Run continuously (loop every N seconds). Without this flag, runs once and exits."
     )
     
+    parser.add_argument(
+        "--ai",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Run the AI diagnosis steps (--no-ai: monitor, heal and alert only)"
+    )
+    
+    parser.add_argument(
+        "--healthy-summary-interval-min",
+        type=float,
+        default=0,
+        metavar="MIN",
+        help="Ask the AI for a health summary when nothing is down, at most every MIN minutes (default 0: never)"
+    )
+    
     args = parser.parse_args()
     
-    print()
-    print("╔" + "═" * 78 + "╗")
-    print("║" + " " * 78 + "║")
-    print("║" + "  🤖 AI-POWERED IT OPERATIONS ORCHESTRATOR  ".center(78) + "║")
-    print("║" + " " * 78 + "║")
-    print("╚" + "═" * 78 + "╝")
-    print()
+    global USE_AI, HEALTHY_SUMMARY_INTERVAL_MIN
+    USE_AI = args.ai
+    HEALTHY_SUMMARY_INTERVAL_MIN = args.healthy_summary_interval_min
+    
+    # Load the LLM into memory in the background while the first check runs
+    if USE_AI:
+        threading.Thread(target=warmup, daemon=True).start()
+    
+    print(_BANNER)
     
     if args.continuous:
         # Continuous monitoring loop
-        orchestrate_continuous(mode=args.mode)
+        asyncio.run(orchestrate_continuous(mode=args.mode))
     else:
         # One-time execution
         if args.mode == "check":
-            orchestrate_check_only()
+            asyncio.run(orchestrate_check_only())
         else:
-            orchestrate_heal_once()
+            asyncio.run(orchestrate_heal_once())
 
 
 if __name__ == "__main__":
@@ -1,8 +1,17 @@
 """
 Configuration for IT Operations Multi-Agent System
+
+LLM model choice: the agents make short tool-calling decisions rather than
+long generations, so a small, explicitly quantized model keeps latency low.
+Q4_K_M is the speed-oriented quant; switch to a Q8_0 tag if you need more
+accuracy and have the memory for it. Tags must match `ollama list` exactly.
 """
 
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -17,13 +26,29 @@ EMAIL_FROM = os.getenv("EMAIL_FROM")
 # App Password from Gmail (NOT your regular password)
 EMAIL_APP_PASSWORD = os.getenv("EMAIL_APP_PASSWORD")
 
-# Where to send alerts (can be same as EMAIL_FROM)
+# Where to send alerts (can be same as EMAIL_FROM; comma-separate multiple addresses)
 EMAIL_TO = os.getenv("EMAIL_TO")
 
 # Gmail SMTP settings (don't change these)
 SMTP_SERVER = "smtp.gmail.com"
 SMTP_PORT = 587
 
+# Reuse one SMTP connection for this many messages before reconnecting
+SMTP_MAX_MESSAGES_PER_CONNECTION = 100
+
+# Socket timeout so a stuck connection is dropped and re-established quickly
+SMTP_TIMEOUT_SECONDS = 10
+
+# -------------------------
+# LLM Settings
+# -------------------------
+
+# Model used for diagnosis and tool-calling decisions
+OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2:3b-instruct-q4_K_M")
+
+# Model for short, strictly-grounded final answers (e.g. llama3.2:1b-instruct-q4_K_M)
+OLLAMA_FINAL_ANSWER_MODEL = os.getenv("OLLAMA_FINAL_ANSWER_MODEL", OLLAMA_MODEL)
+
 # -------------------------
 # Alert Settings
 # -------------------------
@@ -51,17 +76,54 @@ ALERT_LEVELS = {
     }
 }
 
+# Container-down alerts are queued and emailed by a background worker
+ALERT_QUEUE_SIZE = 1024
+ALERT_FLUSH_TIMEOUT_SECONDS = 30  # Max wait at exit for queued alerts to send
+
 # -------------------------
 # Monitoring Settings
 # -------------------------
 
-MONITORING_INTERVAL_SECONDS = 30  # Check every 30 seconds
-MAX_RESTART_ATTEMPTS = 3
-RESTART_TIMEOUT_SECONDS = 10
+MONITORING_INTERVAL_SECONDS = int(os.getenv("MONITORING_INTERVAL_SECONDS", "30"))  # Check every 30 seconds
+MAX_RESTART_ATTEMPTS = int(os.getenv("MAX_RESTART_ATTEMPTS", "3"))
+RESTART_TIMEOUT_SECONDS = int(os.getenv("RESTART_TIMEOUT_SECONDS", "10"))
+MAX_PARALLEL_RESTARTS = int(os.getenv("MAX_PARALLEL_RESTARTS", "10"))  # Concurrent restarts when healing many containers
+DIAGNOSIS_COOLDOWN_SECONDS = int(os.getenv("DIAGNOSIS_COOLDOWN_SECONDS", "300"))  # Don't re-diagnose/re-alert an unchanged incident sooner
 
 # Alert thresholds
-CPU_ALERT_THRESHOLD = 80.0  # Alert if CPU > 80%
-MEMORY_ALERT_THRESHOLD = 80.0  # Alert if memory > 80%
+CPU_ALERT_THRESHOLD = float(os.getenv("CPU_ALERT_THRESHOLD", "80.0"))  # Alert if CPU > 80%
+MEMORY_ALERT_THRESHOLD = float(os.getenv("MEMORY_ALERT_THRESHOLD", "80.0"))  # Alert if memory > 80%
 
 # Critical services (always send email for these)
-CRITICAL_SERVICES = ["prod-web-01", "prod-db-01"]
\ No newline at end of file
+CRITICAL_SERVICES = ["prod-web-01", "prod-db-01"]
+
+
+@dataclass(slots=True, frozen=True)
+class MonitoringConfig:
+    """Immutable monitoring settings; one cached instance is shared by all callers."""
+    monitoring_interval_seconds: int
+    max_restart_attempts: int
+    restart_timeout_seconds: int
+    max_parallel_restarts: int
+    diagnosis_cooldown_seconds: int
+    cpu_alert_threshold: float
+    memory_alert_threshold: float
+    critical_services: Tuple[str, ...]
+
+
+@lru_cache(maxsize=1)
+def get_config() -> MonitoringConfig:
+    """
+    Snapshot of the monitoring settings, coerced once.
+    Read it once at startup and keep the returned object.
+    """
+    return MonitoringConfig(
+        monitoring_interval_seconds=MONITORING_INTERVAL_SECONDS,
+        max_restart_attempts=MAX_RESTART_ATTEMPTS,
+        restart_timeout_seconds=RESTART_TIMEOUT_SECONDS,
+        max_parallel_restarts=MAX_PARALLEL_RESTARTS,
+        diagnosis_cooldown_seconds=DIAGNOSIS_COOLDOWN_SECONDS,
+        cpu_alert_threshold=CPU_ALERT_THRESHOLD,
+        memory_alert_threshold=MEMORY_ALERT_THRESHOLD,
+        critical_services=tuple(CRITICAL_SERVICES),
+    )
@@ -1,16 +1,66 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 from datetime import datetime
-import json
-import random
+from functools import lru_cache
+import numpy as np
+import orjson
+import os
+import time
 from pathlib import Path
+from types import MappingProxyType
 
-app = FastAPI(title="Mock Monitoring API", version="1.0")
+app = FastAPI(
+    title="Mock Monitoring API",
+    version="1.0",
+    default_response_class=ORJSONResponse
+)
+# Compress the larger /servers and logs payloads; tiny bodies such as root()
+# and restart acknowledgements stay under minimum_size and pass through
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
 
 # Load fake server data
 DATA_FILE = Path(__file__).parent / "data" / "servers.json"
-with open(DATA_FILE, 'r') as f:
-    data = json.load(f)
-    SERVERS = {server['hostname']: server for server in data['servers']}
+data = orjson.loads(DATA_FILE.read_bytes())
+SERVERS = MappingProxyType({server['hostname']: server for server in data['servers']})
+
+# SERVERS is never mutated, so index it once instead of scanning per request.
+# Everything below is built before uvicorn starts workers and is read-only
+# afterwards; live values are computed into per-request dicts, never
+# written back.
+_SERVERS_LIST = tuple(SERVERS.values())
+_SERVERS_BY_STATUS = MappingProxyType({
+    status: tuple(s for s in _SERVERS_LIST if s['status'] == status)
+    for status in dict.fromkeys(s['status'] for s in _SERVERS_LIST)
+})
+
+# Encoded /servers responses keyed by status filter (None = unfiltered)
+_LIST_CACHE = MappingProxyType({
+    None: orjson.dumps({"total": len(_SERVERS_LIST), "servers": _SERVERS_LIST}),
+    **{
+        status: orjson.dumps({"total": len(servers), "servers": servers})
+        for status, servers in _SERVERS_BY_STATUS.items()
+    }
+})
+_EMPTY_LIST_BYTES = orjson.dumps({"total": 0, "servers": []})
+
+def _get(hostname: str) -> dict:
+    """Return the server record for hostname or raise a 404."""
+    server = SERVERS.get(hostname)
+    if server is None:
+        raise HTTPException(status_code=404, detail=f"Server {hostname} not found")
+    return server
+
+# One generator per process; each request draws its random values in a
+# single batched call
+_rng = np.random.default_rng()
+
+# Hot callables bound once so handlers skip the module attribute lookups
+_now = datetime.now
+_uniform = _rng.uniform
+_integers = _rng.integers
+_clip = np.clip
+_minimum = np.minimum
 
 # Fake log templates
 LOG_TEMPLATES = [
@@ -24,125 +74,177 @@ LOG_TEMPLATES = [
     "[INFO] Scheduled task completed: DailyBackup"
 ]
 
-@app.get("/")
-def root():
-    return {
-        "service": "Mock Monitoring API",
-        "version": "1.0",
-        "endpoints": [
-            "/servers - List all servers",
-            "/servers/{hostname}/status - Get server status",
-            "/servers/{hostname}/logs - Get server logs",
-            "/servers/{hostname}/metrics - Get detailed metrics"
-        ]
-    }
+# (template, needs_format) pairs so placeholder-free lines skip str.format.
+# Padded by cycling to a power-of-two length so a random byte masked with
+# _TEMPLATE_MASK picks a template without a bounded-range draw.
+_TEMPLATE_SLOTS = 1 << (len(LOG_TEMPLATES) - 1).bit_length()
+_LOG_TEMPLATE_SPECS = tuple(
+    (t, '{' in t) for t in (LOG_TEMPLATES * 2)[:_TEMPLATE_SLOTS]
+)
+_TEMPLATE_MASK = _TEMPLATE_SLOTS - 1
+
+# Fixed log lines for servers reported as down; only the timestamp varies
+_DOWN_CRITICAL = "[CRITICAL] Server not responding"
+_DOWN_ERROR = "[ERROR] Connection refused on primary port"
+
+# Index payload never changes, so encode it once at import
+_ROOT_BYTES = orjson.dumps({
+    "service": "Mock Monitoring API",
+    "version": "1.0",
+    "endpoints": [
+        "/servers - List all servers",
+        "/servers/{hostname}/status - Get server status",
+        "/servers/{hostname}/logs - Get server logs",
+        "/servers/{hostname}/metrics - Get detailed metrics"
+    ]
+})
 
-@app.get("/servers")
-def list_servers(status: str = None):
+@app.get("/", response_class=ORJSONResponse)
+async def root():
+    return Response(content=_ROOT_BYTES, media_type="application/json")
+
+@app.get("/servers", response_class=ORJSONResponse)
+async def list_servers(status: str = None):
     """List all servers, optionally filter by status"""
-    servers_list = list(SERVERS.values())
-    
-    if status:
-        servers_list = [s for s in servers_list if s['status'] == status]
-    
-    return {
-        "total": len(servers_list),
-        "servers": servers_list
-    }
+    # Unknown status values match nothing
+    payload = _LIST_CACHE.get(status or None, _EMPTY_LIST_BYTES)
+    return Response(content=payload, media_type="application/json")
 
-@app.get("/servers/{hostname}/status")
-def get_server_status(hostname: str):
+@app.get("/servers/{hostname}/status", response_class=ORJSONResponse)
+async def get_server_status(hostname: str):
     """Get current status of a specific server"""
-    if hostname not in SERVERS:
-        raise HTTPException(status_code=404, detail=f"Server {hostname} not found")
-    
-    server = SERVERS[hostname].copy()
+    server = _get(hostname)
+    now = _now()  # orjson encodes datetimes natively
     
     # Add some randomness to simulate live metrics
     if server['status'] == 'running':
-        server['cpu_percent'] = round(server['cpu_percent'] + random.uniform(-5, 5), 1)
-        server['memory_percent'] = round(server['memory_percent'] + random.uniform(-3, 3), 1)
-        server['cpu_percent'] = max(0, min(100, server['cpu_percent']))  # Clamp to 0-100
-        server['memory_percent'] = max(0, min(100, server['memory_percent']))
-    
-    server['last_checked'] = datetime.now().isoformat()
+        # Jitter, clamp to 0-100 and round both values in one vectorised pass
+        live = _uniform((-5, -3), (5, 3))
+        live += (server['cpu_percent'], server['memory_percent'])
+        cpu, mem = _clip(live, 0, 100).round(1).tolist()
+        return ORJSONResponse(content={
+            **server,
+            "cpu_percent": cpu,
+            "memory_percent": mem,
+            "last_checked": now
+        })
     
-    return server
+    return ORJSONResponse(content={**server, "last_checked": now})
 
-@app.get("/servers/{hostname}/logs")
-def get_server_logs(hostname: str, lines: int = 10):
+@app.get("/servers/{hostname}/logs", response_class=ORJSONResponse)
+async def get_server_logs(hostname: str, lines: int = 10):
     """Get recent logs from a server"""
-    if hostname not in SERVERS:
-        raise HTTPException(status_code=404, detail=f"Server {hostname} not found")
+    server = _get(hostname)
     
-    server = SERVERS[hostname]
+    # Read the clock once per request; isoformat is the C equivalent of
+    # strftime("%Y-%m-%d %H:%M:%S")
+    ts = _now().isoformat(" ", "seconds")
+    hm = ts[11:]
     
     # Generate fake logs
-    logs = []
-    for i in range(min(lines, 20)):  # Max 20 logs
-        template = random.choice(LOG_TEMPLATES)
-        log_entry = template.format(
-            time=datetime.now().strftime("%H:%M:%S"),
-            memory=random.randint(60, 95)
-        )
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        logs.append(f"[{timestamp}] {log_entry}")
+    n = max(0, min(lines, 20))  # Max 20 logs
+    template_ids = (_integers(0, 256, size=n, dtype=np.uint8) & _TEMPLATE_MASK).tolist()
+    memory_values = _integers(60, 96, size=n).tolist()
+    prefix = f"[{ts}] "
+    logs = [None] * n  # Size is known up front, so fill by index
+    for i in range(n):
+        template, needs_format = _LOG_TEMPLATE_SPECS[template_ids[i]]
+        logs[i] = prefix + (template.format(time=hm, memory=memory_values[i]) if needs_format else template)
     
     # If server is down, add error logs
     if server['status'] == 'down':
-        logs.insert(0, f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [CRITICAL] Server not responding")
-        logs.insert(1, f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] [ERROR] Connection refused on primary port")
+        logs[:0] = (prefix + _DOWN_CRITICAL, prefix + _DOWN_ERROR)
     
-    return {
+    return ORJSONResponse(content={
         "hostname": hostname,
         "log_count": len(logs),
         "logs": logs
+    })
+
+# current/average metrics depend only on the static seed data
+_CURRENT = MappingProxyType({
+    h: {
+        "cpu_percent": srv['cpu_percent'],
+        "memory_percent": srv['memory_percent'],
+        "disk_percent": srv['disk_percent']
+    }
+    for h, srv in SERVERS.items()
+})
+_AVG = MappingProxyType({
+    h: {
+        "cpu_percent": round(srv['cpu_percent'] * 0.8, 1),
+        "memory_percent": round(srv['memory_percent'] * 0.9, 1),
+        "disk_percent": srv['disk_percent']
     }
+    for h, srv in SERVERS.items()
+})
 
-@app.get("/servers/{hostname}/metrics")
-def get_server_metrics(hostname: str, period: str = "1h"):
-    """Get detailed performance metrics"""
-    if hostname not in SERVERS:
-        raise HTTPException(status_code=404, detail=f"Server {hostname} not found")
-    
+# Responses below are cached per time bucket; a new bucket is a new cache
+# key, so stale entries simply age out of the LRU
+METRICS_CACHE_TTL_SECONDS = 1
+
+@lru_cache(maxsize=512)
+def _metrics_bytes(hostname: str, period: str, bucket: int) -> bytes:
+    """Encode a metrics payload; `bucket` only keys the cache."""
     server = SERVERS[hostname]
     
+    # Spike draw, add and cap at 100 as one vectorised kernel
+    peak = _uniform((10, 5), (20, 15))
+    peak += (server['cpu_percent'], server['memory_percent'])
+    peak_cpu, peak_mem = _minimum(peak, 100, out=peak).tolist()
+    
     # Generate fake historical metrics
-    metrics = {
+    return orjson.dumps({
         "hostname": hostname,
         "period": period,
-        "current": {
-            "cpu_percent": server['cpu_percent'],
-            "memory_percent": server['memory_percent'],
-            "disk_percent": server['disk_percent']
-        },
-        "average": {
-            "cpu_percent": round(server['cpu_percent'] * 0.8, 1),
-            "memory_percent": round(server['memory_percent'] * 0.9, 1),
-            "disk_percent": server['disk_percent']
-        },
+        "current": _CURRENT[hostname],
+        "average": _AVG[hostname],
         "peak": {
-            "cpu_percent": min(100, server['cpu_percent'] + random.uniform(10, 20)),
-            "memory_percent": min(100, server['memory_percent'] + random.uniform(5, 15)),
+            "cpu_percent": peak_cpu,
+            "memory_percent": peak_mem,
             "disk_percent": server['disk_percent']
         }
-    }
-    
-    return metrics
+    })
 
-@app.post("/servers/{hostname}/restart")
-def restart_server(hostname: str):
-    """Simulate server restart"""
-    if hostname not in SERVERS:
-        raise HTTPException(status_code=404, detail=f"Server {hostname} not found")
-    
-    return {
+@lru_cache(maxsize=512)
+def _restart_bytes(hostname: str, second: int) -> bytes:
+    """Encode a restart acknowledgement stamped with wall-clock `second`."""
+    hhmmss = datetime.fromtimestamp(second).isoformat(timespec='seconds')[11:]
+    return orjson.dumps({
         "hostname": hostname,
         "status": "restarting",
-        "message": f"Server {hostname} restart initiated at {datetime.now().strftime('%H:%M:%S')}",
+        "message": f"Server {hostname} restart initiated at {hhmmss}",
         "estimated_time": "2-3 minutes"
-    }
+    })
+
+@app.get("/servers/{hostname}/metrics", response_class=ORJSONResponse)
+async def get_server_metrics(hostname: str, period: str = "1h"):
+    """Get detailed performance metrics"""
+    _get(hostname)
+    
+    bucket = int(time.monotonic() // METRICS_CACHE_TTL_SECONDS)
+    return Response(content=_metrics_bytes(hostname, period, bucket), media_type="application/json")
+
+@app.post("/servers/{hostname}/restart", response_class=ORJSONResponse)
+async def restart_server(hostname: str):
+    """Simulate server restart"""
+    _get(hostname)
+    
+    # Keyed on the wall-clock second, so a cached body is byte-identical to
+    # a freshly built one
+    return Response(content=_restart_bytes(hostname, int(time.time())), media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
\ No newline at end of file
+    # Import-string form so uvicorn can spawn one worker per core; app_dir
+    # makes it resolve however the script is launched (directly or with -m).
+    # "auto" picks uvloop where it is installed (it has no Windows build).
+    uvicorn.run(
+        "monitoring_api:app",
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host="0.0.0.0",
+        port=8001,
+        loop="auto",
+        http="httptools",
+        workers=os.cpu_count()
+    )
\ No newline at end of file